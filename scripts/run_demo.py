@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Run Freight Calculator Demo
+===========================
+Voyage economics for Cargill's vessels and committed cargoes, with a TCE
+matrix and recommended assignments.
+
+Usage:
+    python scripts/run_demo.py
+"""
+
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Setup paths
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+
+# Add project root to path (for the src package)
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.freight_calculator import (
+    FreightCalculator, PortDistanceManager,
+    create_cargill_vessels, create_cargill_cargoes, create_bunker_prices
+)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    print("=" * 80)
+    print("CARGILL OCEAN TRANSPORTATION DATATHON 2026 - FREIGHT CALCULATOR")
+    print("=" * 80)
+    
+    # Initialize
+    distance_mgr = PortDistanceManager(os.path.join(DATA_DIR, 'Port_Distances.csv'))
+    bunker_prices = create_bunker_prices()
+    calculator = FreightCalculator(distance_mgr, bunker_prices)
+    
+    # Load data
+    cargill_vessels = create_cargill_vessels()
+    cargill_cargoes = create_cargill_cargoes()
+    
+    lines = ["\n📦 CARGILL VESSELS:"]
+    lines += [
+        f"  • {v.name:20} | DWT: {v.dwt:,} MT | At: {v.current_port:15} | ETD: {v.etd}"
+        for v in cargill_vessels
+    ]
+    lines.append("\n📦 CARGILL COMMITTED CARGOES:")
+    lines += [
+        f"  • {c.name[:40]:40} | {c.quantity:,} MT | Laycan: {c.laycan_start} - {c.laycan_end}"
+        for c in cargill_cargoes
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Calculate all voyage combinations
+    print("\n" + "=" * 80)
+    print("VOYAGE ANALYSIS - ALL COMBINATIONS")
+    print("=" * 80)
+    
+    # Whole grid in one batch; infeasible pairs come back as None, not exceptions.
+    # Those few are re-run one at a time to report why they were rejected.
+    batch = calculator.calculate_voyage_batch(cargill_vessels, cargill_cargoes, use_eco_speed=True)
+    results = []
+    lines = []
+    
+    for i, vessel in enumerate(cargill_vessels):
+        for j, cargo in enumerate(cargill_cargoes):
+            lines.append(f"\n{vessel.name} → {cargo.name[:35]}")
+            result = batch.row(i, j)
+            if result is None:
+                try:
+                    calculator.calculate_voyage(vessel, cargo, use_eco_speed=True)
+                except ValueError as e:
+                    lines.append(f"  ⚠️  Error: {e}")
+                continue
+            results.append(result)
+            
+            laycan_status = "✅ CAN MAKE" if result.can_make_laycan else "❌ CANNOT MAKE"
+            
+            lines += [
+                f"  Laycan: {laycan_status} (Arrives: {result.arrival_date.strftime('%d %b')})",
+                f"  Duration: {result.total_days:.1f} days (Ballast: {result.ballast_days:.1f} + Laden: {result.laden_days:.1f} + Port: {result.load_days + result.discharge_days:.1f})",
+                f"  Cargo: {result.cargo_quantity:,} MT",
+                f"  Revenue: ${result.net_freight:,.0f} (after {cargo.commission*100:.2f}% commission)",
+                f"  Bunker: ${result.total_bunker_cost:,.0f} ({result.vlsfo_consumed:.0f} MT VLSFO)",
+                f"  Port Costs: ${result.port_costs:,.0f}",
+                f"  Hire Cost: ${result.hire_cost:,.0f}",
+                "  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+                f"  💰 TCE: ${result.tce:,.0f}/day | Net Profit: ${result.net_profit:,.0f}",
+            ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Summary table
+    print("\n" + "=" * 80)
+    print("SUMMARY - TCE COMPARISON MATRIX (USD/day)")
+    print("=" * 80)
+    
+    # Create summary dataframe
+    summary_rows = [
+        (r.vessel_name, r.cargo_name[:25], r.tce, r.can_make_laycan, r.net_profit)
+        for r in results
+    ]
+    vessel_width = max([len('Vessel')] + [len(row[0]) for row in summary_rows])
+    summary_lines = [
+        f"{'Vessel':<{vessel_width}}  {'Cargo':<25}  {'TCE':>10}  "
+        f"{'Can Make Laycan':<15}  {'Net Profit':>14}"
+    ]
+    summary_lines += [
+        f"{vessel:<{vessel_width}}  {cargo:<25}  {tce:>10,.2f}  {laycan!s:<15}  {profit:>14,.2f}"
+        for vessel, cargo, tce, laycan, profit in summary_rows
+    ]
+    sys.stdout.write("\n\n" + "\n".join(summary_lines) + "\n")
+
+    # Same figures as a vessel x cargo grid (blank = infeasible pair)
+    tce_matrix = pd.DataFrame(
+        np.where(batch.valid, batch['tce'], np.nan).round(0),
+        index=batch.vessel_names,
+        columns=[name[:25] for name in batch.cargo_names],
+    )
+    print("\n")
+    print(tce_matrix.to_string(na_rep='-', float_format='{:,.0f}'.format))
+    
+    # Best assignments
+    print("\n" + "=" * 80)
+    print("RECOMMENDED ASSIGNMENTS (Highest total TCE)")
+    print("=" * 80)
+    
+    feasible = batch['can_make_laycan']   # already False for invalid pairs
+    if feasible.any():
+        from scipy.optimize import linear_sum_assignment
+
+        # Hungarian algorithm minimizes, so negate TCE; penalize infeasible pairs
+        INVALID_PENALTY = 1e12
+        cost_matrix = np.where(feasible, -np.nan_to_num(batch['tce']), INVALID_PENALTY)
+        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        recommendations = [
+            batch.row(i, j)
+            for i, j in zip(row_ind.tolist(), col_ind.tolist())
+            if feasible[i, j]
+        ]
+        recommendations.sort(key=lambda r: r.tce, reverse=True)
+        
+        total_profit = 0
+        for r in recommendations:
+            print(f"\n✅ {r.vessel_name} → {r.cargo_name[:35]}")
+            print(f"   TCE: ${r.tce:,.0f}/day | Profit: ${r.net_profit:,.0f}")
+            total_profit += r.net_profit
+        
+        print(f"\n💰 TOTAL PORTFOLIO PROFIT: ${total_profit:,.0f}")
@@ -8,6 +8,7 @@ Usage:
     python scripts/run_optimizer.py
 """
 
+import logging
 import os
 import sys
 
@@ -36,6 +37,8 @@ from src.portfolio_optimizer import (
 )
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     print("=" * 80)
     print("CARGILL DATATHON 2026 - PORTFOLIO OPTIMIZATION")
     print("=" * 80)
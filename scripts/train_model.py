@@ -5,6 +5,8 @@ Trains a LightGBM model to predict port waiting times.
 
 Run from project root:
     python scripts/train_model.py
+
+Set SAVE_SHAP_PLOTS=1 to also render the SHAP summary/bar plots.
 """
 
 import pandas as pd
@@ -25,6 +27,9 @@ RAW_DATA_DIR = os.path.join(DATA_DIR, 'raw')
 MODELS_DIR = os.path.join(PROJECT_ROOT, 'models')
 SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
 
+# SHAP plots are slow to render; only write them when explicitly requested
+SAVE_SHAP_PLOTS = os.environ.get('SAVE_SHAP_PLOTS', '0') == '1'
+
 # Add src to path for imports
 sys.path.insert(0, SRC_DIR)
 
@@ -291,8 +296,9 @@ importance_df = pd.DataFrame({
     'importance': model.feature_importance(importance_type='gain')
 }).sort_values('importance', ascending=False)
 
-for i, row in importance_df.head(10).iterrows():
-    print(f"   {row['feature']}: {row['importance']:.0f}")
+top_importance = importance_df.head(10)
+for feat, imp in zip(top_importance['feature'].to_numpy(), top_importance['importance'].to_numpy()):
+    print(f"   {feat}: {imp:.0f}")
 
 # ============================================================================
 # 6.5 SHAP ANALYSIS (Required by Datathon for Explainability)
@@ -322,43 +328,50 @@ if HAS_SHAP and HAS_MATPLOTLIB:
     }).sort_values('mean_shap', ascending=False)
 
     print("\n   SHAP Feature Importance (Top 10):")
-    for i, row in shap_importance.head(10).iterrows():
-        print(f"      {row['feature']}: {row['mean_shap']:.4f}")
+    top_shap = shap_importance.head(10)
+    for feat, val in zip(top_shap['feature'].to_numpy(), top_shap['mean_shap'].to_numpy()):
+        print(f"      {feat}: {val:.4f}")
 
     # Store SHAP values for model_info.json
     shap_values_dict = {
         'shap_feature_importance': {
-            row['feature']: float(row['mean_shap'])
-            for _, row in shap_importance.iterrows()
+            feat: float(val)
+            for feat, val in zip(shap_importance['feature'].to_numpy(), shap_importance['mean_shap'].to_numpy())
         },
         'sample_size': sample_size,
     }
 
-    # Create and save SHAP summary plot
-    print("\n   Generating SHAP summary plot...")
-    try:
-        plt.figure(figsize=(10, 8))
-        shap.summary_plot(shap_values, X_sample, feature_names=available_features, show=False)
-        plt.tight_layout()
-
-        shap_plot_path = os.path.join(MODELS_DIR, 'shap_summary.png')
-        plt.savefig(shap_plot_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"   SHAP plot saved to: {shap_plot_path}")
-
-        # Also create a bar plot for cleaner visualization
-        plt.figure(figsize=(10, 6))
-        shap.summary_plot(shap_values, X_sample, feature_names=available_features,
-                          plot_type="bar", show=False)
-        plt.tight_layout()
-
-        shap_bar_path = os.path.join(MODELS_DIR, 'shap_importance_bar.png')
-        plt.savefig(shap_bar_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"   SHAP bar plot saved to: {shap_bar_path}")
-
-    except Exception as e:
-        print(f"   [WARN] Could not save SHAP plot: {e}")
+    # Plot rendering is the slowest part of this section, so it is opt-in.
+    # Set SAVE_SHAP_PLOTS=1 to write the summary/bar PNGs to MODELS_DIR.
+    if SAVE_SHAP_PLOTS:
+        print("\n   Generating SHAP summary plot...")
+        try:
+            plt.figure(figsize=(10, 8))
+            shap.summary_plot(shap_values, X_sample, feature_names=available_features, show=False)
+            plt.tight_layout()
+
+            shap_plot_path = os.path.join(MODELS_DIR, 'shap_summary.png')
+            plt.savefig(shap_plot_path, dpi=150, bbox_inches='tight')
+            plt.close()
+            print(f"   SHAP plot saved to: {shap_plot_path}")
+
+            # Bar plot straight from the mean |SHAP| values computed above
+            # (shap.summary_plot(plot_type="bar") would recompute them)
+            bar_data = shap_importance.head(20).iloc[::-1]
+            plt.figure(figsize=(10, 6))
+            plt.barh(bar_data['feature'], bar_data['mean_shap'])
+            plt.xlabel('mean(|SHAP value|)')
+            plt.tight_layout()
+
+            shap_bar_path = os.path.join(MODELS_DIR, 'shap_importance_bar.png')
+            plt.savefig(shap_bar_path, dpi=150, bbox_inches='tight')
+            plt.close()
+            print(f"   SHAP bar plot saved to: {shap_bar_path}")
+
+        except Exception as e:
+            print(f"   [WARN] Could not save SHAP plot: {e}")
+    else:
+        print("\n   [SKIP] SHAP plots (set SAVE_SHAP_PLOTS=1 to generate)")
 
 else:
     print("   [SKIP] SHAP analysis requires 'shap' and 'matplotlib' packages")
@@ -391,15 +404,16 @@ model_info = {
         'within_2_days_pct': float(test_metrics['within_2_days']),
     },
     'gain_feature_importance': {
-        row['feature']: float(row['importance'])
-        for _, row in importance_df.iterrows()
+        feat: float(imp)
+        for feat, imp in zip(importance_df['feature'].to_numpy(), importance_df['importance'].to_numpy())
     },
 }
 
 # Add SHAP values if available
 if shap_values_dict:
     model_info['shap_analysis'] = shap_values_dict
-    model_info['shap_plot_path'] = os.path.join(MODELS_DIR, 'shap_summary.png')
+    if SAVE_SHAP_PLOTS:
+        model_info['shap_plot_path'] = os.path.join(MODELS_DIR, 'shap_summary.png')
 
 model_info_path = os.path.join(MODELS_DIR, 'model_info.json')
 with open(model_info_path, 'w') as f:
@@ -420,10 +434,11 @@ print("-" * 60)
 
 from ml.port_congestion_predictor import PortCongestionPredictor
 
+# Reuse the activity data loaded in section 1 instead of re-reading the CSV
 predictor = PortCongestionPredictor(
     model_path=model_path,
-    data_path=os.path.join(RAW_DATA_DIR, 'Daily_Port_Activity_Data_and_Trade_Estimates.csv'),
-    port_database_path=os.path.join(DATA_DIR, 'PortWatch_ports_database.csv')
+    port_database_path=os.path.join(DATA_DIR, 'PortWatch_ports_database.csv'),
+    activity_df=activity_df,
 )
 
 print(f"   Model available: {predictor.is_model_available()}")
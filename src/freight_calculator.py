@@ -11,10 +11,13 @@ This module calculates:
 - Time Charter Equivalent (TCE)
 """
 
-import pandas as pd
+import re
+from copy import copy
+
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple, Set
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Optional, List, Dict, Tuple, Set, Sequence, Mapping
 from datetime import datetime, timedelta
 
 
@@ -22,7 +25,7 @@ from datetime import datetime, timedelta
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vessel:
     """Represents a Capesize vessel with all operational parameters."""
     name: str
@@ -59,7 +62,7 @@ class Vessel:
     is_cargill: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cargo:
     """Represents a cargo with loading/discharge specifications."""
     name: str
@@ -95,7 +98,7 @@ class Cargo:
     half_freight_threshold: Optional[int] = None  # If cargo > this, half freight applies
 
 
-@dataclass
+@dataclass(slots=True)
 class VoyageConfig:
     """Configuration constants for voyage calculations."""
     misc_costs: float = 15000  # Typical for Capesize (canal fees, surveys, etc.)
@@ -105,7 +108,22 @@ class VoyageConfig:
     bunker_threshold_mt: float = 50.0  # Minimum fuel to trigger bunkering stop
 
 
-@dataclass
+# Regional bunker-price fallbacks, checked in order: one compiled alternation
+# per region -> (hub port whose prices apply, default if the hub is missing)
+_BUNKER_REGIONS = tuple(
+    (re.compile('|'.join(map(re.escape, keywords))), hub, default)
+    for keywords, hub, default in (
+        (('CHINA', 'QINGDAO', 'FANGCHENG', 'CAOFEIDIAN', 'LIANYUNGANG'), 'Qingdao', 643),
+        (('SINGAPORE', 'THAILAND', 'MAP TA PHUT'), 'Singapore', 490),
+        (('AUSTRALIA', 'HEDLAND', 'DAMPIER'), 'Singapore', 490),
+        (('BRAZIL', 'ITAGUAI', 'TUBARAO', 'MADEIRA'), 'Gibraltar', 474),
+        (('GUINEA', 'KAMSAR', 'AFRICA'), 'Gibraltar', 474),
+        (('INDIA', 'PARADIP', 'MUNDRA', 'KANDLA'), 'Fujairah', 478),
+    )
+)
+
+
+@dataclass(slots=True)
 class BunkerPrices:
     """Bunker prices at various ports."""
     prices: Dict[str, Dict[str, float]] = field(default_factory=dict)
@@ -119,26 +137,18 @@ class BunkerPrices:
             if p.upper() in port_upper or port_upper in p.upper():
                 return prices.get(fuel_type, prices.get('VLSFO', 490))
         
-        # Regional fallback
-        if any(x in port_upper for x in ['CHINA', 'QINGDAO', 'FANGCHENG', 'CAOFEIDIAN', 'LIANYUNGANG']):
-            return self.prices.get('Qingdao', {}).get(fuel_type, 643)
-        if any(x in port_upper for x in ['SINGAPORE', 'THAILAND', 'MAP TA PHUT']):
-            return self.prices.get('Singapore', {}).get(fuel_type, 490)
-        if any(x in port_upper for x in ['AUSTRALIA', 'HEDLAND', 'DAMPIER']):
-            return self.prices.get('Singapore', {}).get(fuel_type, 490)
-        if any(x in port_upper for x in ['BRAZIL', 'ITAGUAI', 'TUBARAO', 'MADEIRA']):
-            return self.prices.get('Gibraltar', {}).get(fuel_type, 474)
-        if any(x in port_upper for x in ['GUINEA', 'KAMSAR', 'AFRICA']):
-            return self.prices.get('Gibraltar', {}).get(fuel_type, 474)
-        if any(x in port_upper for x in ['INDIA', 'PARADIP', 'MUNDRA', 'KANDLA']):
-            return self.prices.get('Fujairah', {}).get(fuel_type, 478)
+        # Regional fallback (first matching region wins)
+        for pattern, hub, default in _BUNKER_REGIONS:
+            if pattern.search(port_upper):
+                return self.prices.get(hub, {}).get(fuel_type, default)
         
         # Default to Singapore
         return self.prices.get('Singapore', {}).get(fuel_type, 490)
 
 
-# All available bunkering ports (evaluate all candidates for each voyage)
-ALL_BUNKER_PORTS = [
+# All available bunkering ports (evaluate all candidates for each voyage).
+# A tuple so it can key the calculator's per-candidate price/leg caches as is.
+ALL_BUNKER_PORTS = (
     'Singapore',      # SE Asia hub
     'Fujairah',       # Middle East hub
     'Rotterdam',      # NW Europe hub
@@ -148,10 +158,10 @@ ALL_BUNKER_PORTS = [
     'Shanghai',       # China hub
     'Port Louis',     # Indian Ocean hub
     'Richards Bay',   # South African hub
-]
+)
 
 
-def get_bunker_candidates(vessel_port: str, load_port: str) -> List[str]:
+def get_bunker_candidates(vessel_port: str, load_port: str) -> Tuple[str, ...]:
     """
     Get all bunker port candidates.
     Returns all 9 ports for comprehensive optimization.
@@ -159,7 +169,7 @@ def get_bunker_candidates(vessel_port: str, load_port: str) -> List[str]:
     return ALL_BUNKER_PORTS
 
 
-@dataclass
+@dataclass(slots=True)
 class VoyageResult:
     """Results of a voyage calculation."""
     vessel_name: str
@@ -224,17 +234,104 @@ class VoyageResult:
     bunker_fuel_vlsfo_qty: float                 # VLSFO quantity purchased (MT)
     bunker_fuel_mgo_qty: float                   # MGO quantity purchased (MT)
 
+    def rounded(self) -> 'VoyageResult':
+        """Copy with every float figure rounded to 2 dp (the display form)."""
+        return copy(self)._round_in_place()
+
+    def _round_in_place(self) -> 'VoyageResult':
+        """Round every float field to 2 dp on this instance; returns self."""
+        for name in _ROUNDED_FIELDS:
+            setattr(self, name, round(getattr(self, name), 2))
+        return self
+
+
+# VoyageResult fields shown rounded to 2 dp (every float-typed field)
+_ROUNDED_FIELDS = tuple(f.name for f in fields(VoyageResult) if f.type is float)
+
+
+class VoyageResultBuffer:
+    """
+    Columnar (struct-of-arrays) voyage results for a vessel x cargo grid.
+
+    Holds one unrounded (n_vessels, n_cargoes) array per VoyageResult field,
+    plus a 'valid' mask. Index it like a dict of columns; row() builds a
+    rounded VoyageResult for one pair when a caller needs the object form.
+    """
+
+    # Columns row() builds separately
+    _SPECIAL = {'valid', 'arrival_date', 'cargo_quantity'}
+
+    def __init__(
+        self,
+        vessel_names: List[str],
+        cargo_names: List[str],
+        laycan_start: np.ndarray,
+        laycan_end: np.ndarray,
+        columns: Dict[str, np.ndarray],
+    ):
+        self.vessel_names = vessel_names
+        self.cargo_names = cargo_names
+        self.laycan_start = laycan_start      # datetime64[us], per cargo
+        self.laycan_end = laycan_end
+        self.columns = columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def keys(self):
+        return self.columns.keys()
+
+    @property
+    def valid(self) -> np.ndarray:
+        return self.columns['valid']
+
+    def row(self, i: int, j: int) -> Optional[VoyageResult]:
+        """VoyageResult for vessel i / cargo j (None if the pair is invalid)."""
+        if not self.valid[i, j]:
+            return None
+        cols = self.columns
+        values = {}
+        for name, col in cols.items():
+            if name in self._SPECIAL:
+                continue
+            value = col[i, j]
+            if name == 'selected_bunker_port':
+                values[name] = value          # object array: already str/None
+            else:
+                values[name] = value.item()
+        return VoyageResult(
+            vessel_name=self.vessel_names[i],
+            cargo_name=self.cargo_names[j],
+            arrival_date=cols['arrival_date'][i, j].item(),
+            laycan_start=self.laycan_start[j].item(),
+            laycan_end=self.laycan_end[j].item(),
+            cargo_quantity=int(cols['cargo_quantity'][i, j]),
+            **values,
+        )._round_in_place()
+
 
 # =============================================================================
 # PORT DISTANCE MANAGER
 # =============================================================================
 
+import csv
+import functools
+import sys
 import warnings
 import logging
 
-# Configure logging for distance lookups
-logging.basicConfig(level=logging.INFO)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Logger for distance lookups. The library does not configure the root
+# logger; applications opt in with their own logging config.
 distance_logger = logging.getLogger('PortDistanceManager')
+distance_logger.addHandler(logging.NullHandler())
 
 
 class DistanceSource:
@@ -245,6 +342,708 @@ class DistanceSource:
     NOT_FOUND = 'NOT_FOUND'
 
 
+# Port name mapping for common variations. Names are interned once so
+# alias/distance-table keys compare by identity.
+_PORT_ALIASES = {
+    sys.intern(standard): tuple(sys.intern(a) for a in aliases)
+    for standard, aliases in {
+        'QINGDAO': ('QINGDAO', 'DAGANG (QINGDAO)'),
+        'KAMSAR': ('KAMSAR ANCHORAGE', 'PORT KAMSAR'),
+        'KAMSAR ANCHORAGE': ('KAMSAR ANCHORAGE', 'PORT KAMSAR'),  # Allow both directions
+        'SINGAPORE': ('SINGAPORE',),
+        'PORT HEDLAND': ('PORT HEDLAND',),
+        'ITAGUAI': ('ITAGUAI',),
+        'TUBARAO': ('TUBARAO',),
+        'GWANGYANG': ('GWANGYANG LNG TERMINAL', 'GWANGYANG'),
+        'FANGCHENG': ('FANGCHENG',),
+        'MAP TA PHUT': ('MAP TA PHUT',),
+        'DAMPIER': ('DAMPIER',),
+        'SALDANHA BAY': ('SALDANHA BAY',),
+        'ROTTERDAM': ('ROTTERDAM',),
+        'CAOFEIDIAN': ('CAOFEIDIAN',),
+        'LIANYUNGANG': ('LIANYUNGANG',),
+        'PARADIP': ('PARADIP',),
+        'MUNDRA': ('MUNDRA',),
+        'KANDLA': ('KANDLA',),
+        'PONTA DA MADEIRA': ('PONTA DA MADEIRA', 'SAO LUIS'),
+        'TIANJIN': ('TIANJIN', 'XINGANG'),
+        'TABONEO': ('TABONEO',),
+        'KRISHNAPATNAM': ('KRISHNAPATNAM',),
+        'VANCOUVER': ('VANCOUVER', 'VANCOUVER (CANADA)'),  # Added CSV variant
+        'MANGALORE': ('MANGALORE', 'NEW MANGALORE'),
+        'TELUK RUBIAH': ('TELUK RUBIAH',),
+        'PORT TALBOT': ('PORT TALBOT',),
+        'XIAMEN': ('XIAMEN',),
+        'JINGTANG': ('JINGTANG',),
+        'VIZAG': ('VIZAG', 'VISAKHAPATNAM'),
+        'JUBAIL': ('JUBAIL',),
+        'SHANGHAI': ('SHANGHAI',),
+        # Bunker port aliases
+        'FUJAIRAH': ('FUJAIRAH',),
+        'GIBRALTAR': ('GIBRALTAR',),
+        'DURBAN': ('DURBAN',),
+        'PORT LOUIS': ('PORT LOUIS',),
+        'RICHARDS BAY': ('RICHARDS BAY',),
+    }.items()
+}
+
+# =================================================================
+# ESTIMATED DISTANCES - Only for routes NOT in Port_Distances.csv
+# =================================================================
+# These are fallback estimates used ONLY when CSV lookup fails.
+# CSV lookup takes priority and should cover most routes.
+#
+# NOTE: Estimates were validated against CSV on 2026-01-25.
+#       Routes that exist in CSV have been removed.
+#       Remaining estimates are for routes truly missing from CSV.
+# =================================================================
+
+_ESTIMATED_DISTANCES = {
+    # -----------------------------------------------------------------
+    # MAP TA PHUT (Thailand) - Limited coverage in CSV
+    # Vessel: OCEAN HORIZON starts here
+    # -----------------------------------------------------------------
+    ('MAP TA PHUT', 'PORT HEDLAND'): 2800,       # ~9.3 days at 12.5 kn
+    ('MAP TA PHUT', 'KAMSAR ANCHORAGE'): 9500,   # ~31.7 days at 12.5 kn
+    ('MAP TA PHUT', 'ITAGUAI'): 12500,           # ~41.7 days at 12.5 kn
+    ('MAP TA PHUT', 'DAMPIER'): 2700,            # Similar to Port Hedland
+    ('MAP TA PHUT', 'TUBARAO'): 12600,           # Similar to Itaguai
+    ('MAP TA PHUT', 'SALDANHA BAY'): 6800,       # Via Indian Ocean
+
+    # -----------------------------------------------------------------
+    # GWANGYANG (S. Korea) - CSV only has LNG Terminal variant
+    # Vessel: PACIFIC GLORY, MOUNTAIN TRADER start here
+    # Note: PORT HEDLAND route exists via GWANGYANG LNG TERMINAL alias
+    # -----------------------------------------------------------------
+    ('GWANGYANG', 'KAMSAR ANCHORAGE'): 11500,    # ~38.3 days at 12.5 kn
+    ('GWANGYANG', 'ITAGUAI'): 11800,             # ~39.3 days at 12.5 kn
+    ('GWANGYANG', 'TUBARAO'): 11700,             # Similar to Itaguai
+    ('GWANGYANG', 'SALDANHA BAY'): 9200,         # Via Indian Ocean
+
+    # -----------------------------------------------------------------
+    # PORT TALBOT (Wales, UK) - Limited coverage in CSV
+    # Vessel: IRON CENTURY starts here
+    # Note: ITAGUAI and TUBARAO routes exist in CSV
+    # -----------------------------------------------------------------
+    ('PORT TALBOT', 'KAMSAR ANCHORAGE'): 2800,   # ~9.3 days at 12.5 kn
+    ('PORT TALBOT', 'PORT HEDLAND'): 11500,      # ~38.3 days at 12.5 kn
+    ('PORT TALBOT', 'DAMPIER'): 11600,           # Similar to Port Hedland
+    ('PORT TALBOT', 'VANCOUVER'): 7800,          # Via Atlantic/Panama
+
+    # -----------------------------------------------------------------
+    # JUBAIL (Saudi Arabia) - Limited coverage in CSV
+    # Vessel: TITAN LEGACY starts here
+    # Note: TUBARAO route exists in CSV
+    # -----------------------------------------------------------------
+    ('JUBAIL', 'KAMSAR ANCHORAGE'): 6500,        # ~21.7 days at 12.5 kn
+    ('JUBAIL', 'PORT HEDLAND'): 5200,            # ~17.3 days at 12.5 kn
+    ('JUBAIL', 'ITAGUAI'): 9800,                 # ~32.7 days at 12.5 kn
+    ('JUBAIL', 'TABONEO'): 4500,                 # ~15 days at 12.5 kn
+    ('JUBAIL', 'DAMPIER'): 5100,                 # Similar to Port Hedland
+
+    # -----------------------------------------------------------------
+    # India ports - Various coverage gaps
+    # Vessels: ATLANTIC FORTUNE (Paradip), POLARIS SPIRIT (Kandla),
+    #          NAVIS PRIDE (Mundra), ZENITH GLORY (Vizag)
+    # -----------------------------------------------------------------
+    ('PARADIP', 'PORT HEDLAND'): 4100,           # ~13.7 days at 12.5 kn
+    ('PARADIP', 'KAMSAR ANCHORAGE'): 7600,       # ~25.3 days at 12.5 kn
+    ('PARADIP', 'ITAGUAI'): 10200,               # ~34 days at 12.5 kn
+
+    ('MUNDRA', 'KAMSAR ANCHORAGE'): 6200,        # ~20.7 days at 12.5 kn
+    ('MUNDRA', 'PORT HEDLAND'): 4800,            # ~16 days at 12.5 kn
+    ('MUNDRA', 'ITAGUAI'): 9500,                 # ~31.7 days at 12.5 kn
+
+    ('KANDLA', 'PORT HEDLAND'): 4900,            # ~16.3 days at 12.5 kn
+    ('KANDLA', 'KAMSAR ANCHORAGE'): 6100,        # ~20.3 days at 12.5 kn
+    ('KANDLA', 'ITAGUAI'): 9400,                 # ~31.3 days at 12.5 kn
+
+    # VIZAG routes - some exist in CSV, keeping only missing ones
+    ('VIZAG', 'PORT HEDLAND'): 4200,             # ~14 days at 12.5 kn
+    ('VIZAG', 'ITAGUAI'): 10500,                 # ~35 days at 12.5 kn
+
+    # -----------------------------------------------------------------
+    # XIAMEN (China) - Limited coverage in CSV
+    # Vessel: EVEREST OCEAN starts here
+    # -----------------------------------------------------------------
+    ('XIAMEN', 'KAMSAR ANCHORAGE'): 12200,       # ~40.7 days at 12.5 kn
+
+    # -----------------------------------------------------------------
+    # Cargo route estimates (load port -> discharge port)
+    # -----------------------------------------------------------------
+    ('KAMSAR ANCHORAGE', 'MANGALORE'): 7200,     # Guinea Alumina cargo
+    ('TUBARAO', 'TELUK RUBIAH'): 10800,          # Vale Malaysia cargo
+
+    # -----------------------------------------------------------------
+    # Additional market cargo routes (added based on warnings)
+    # -----------------------------------------------------------------
+    # TABONEO (Indonesia) routes for Adaro Coal cargo
+    ('QINGDAO', 'TABONEO'): 2400,                # ~8 days at 12.5 kn
+    ('GWANGYANG', 'TABONEO'): 2200,              # ~7.3 days at 12.5 kn
+
+    # PONTA DA MADEIRA (Brazil) routes for Vale cargo
+    ('MAP TA PHUT', 'PONTA DA MADEIRA'): 12600,  # ~42 days at 12.5 kn
+    ('GWANGYANG', 'PONTA DA MADEIRA'): 11900,    # ~39.7 days at 12.5 kn
+
+    # VANCOUVER (Canada) routes for Teck coal cargo
+    ('MAP TA PHUT', 'VANCOUVER'): 7200,          # ~24 days at 12.5 kn
+
+    # DAMPIER (Australia) routes for Rio Tinto cargo
+    ('GWANGYANG', 'DAMPIER'): 3500,              # ~11.7 days at 12.5 kn
+
+    # ROTTERDAM (Netherlands) market vessel position routes
+    ('ROTTERDAM', 'KAMSAR ANCHORAGE'): 3200,     # ~10.7 days at 12.5 kn
+    ('ROTTERDAM', 'PORT HEDLAND'): 11500,        # ~38.3 days at 12.5 kn
+
+    # -----------------------------------------------------------------
+    # Singapore hub - reference point
+    # -----------------------------------------------------------------
+    ('SINGAPORE', 'PORT HEDLAND'): 1678,         # Well-known route
+
+    # =================================================================
+    # BUNKER PORT DISTANCES - Added to reduce fallback rate
+    # =================================================================
+    # Distances from all 9 major bunker ports to common load/discharge
+    # ports. These are great circle estimates optimized for the bunker
+    # optimization algorithm to find optimal bunkering locations.
+    # =================================================================
+
+    # -----------------------------------------------------------------
+    # SINGAPORE (SE Asia Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('SINGAPORE', 'KAMSAR ANCHORAGE'): 8500,     # Singapore to Guinea
+    ('SINGAPORE', 'ITAGUAI'): 11200,             # Singapore to Brazil
+    ('SINGAPORE', 'TUBARAO'): 11300,             # Singapore to Brazil
+    ('SINGAPORE', 'DAMPIER'): 1750,              # Singapore to Australia
+    ('SINGAPORE', 'TABONEO'): 680,               # Singapore to Indonesia
+    ('SINGAPORE', 'PONTA DA MADEIRA'): 11400,    # Singapore to Brazil
+    ('SINGAPORE', 'KRISHNAPATNAM'): 1850,        # Singapore to India
+    ('SINGAPORE', 'TELUK RUBIAH'): 220,          # Singapore to Malaysia
+    ('SINGAPORE', 'MANGALORE'): 2100,            # Singapore to India
+    ('SINGAPORE', 'GWANGYANG'): 2460,            # Singapore to S.Korea
+    ('SINGAPORE', 'QINGDAO'): 2460,              # Singapore to China
+    ('SINGAPORE', 'SHANGHAI'): 2200,             # Singapore to China
+    ('SINGAPORE', 'FANGCHENG'): 1300,            # Singapore to China
+    ('SINGAPORE', 'CAOFEIDIAN'): 2650,           # Singapore to China
+    ('SINGAPORE', 'TIANJIN'): 2700,              # Singapore to China
+    ('SINGAPORE', 'LIANYUNGANG'): 2550,          # Singapore to China
+    ('SINGAPORE', 'PARADIP'): 1950,              # Singapore to India
+    ('SINGAPORE', 'MUNDRA'): 2400,               # Singapore to India
+    ('SINGAPORE', 'KANDLA'): 2500,               # Singapore to India
+    ('SINGAPORE', 'VIZAG'): 1900,                # Singapore to India
+    ('SINGAPORE', 'SALDANHA BAY'): 5600,         # Singapore to S.Africa
+    ('SINGAPORE', 'ROTTERDAM'): 9200,            # Singapore to Netherlands
+    ('SINGAPORE', 'VANCOUVER'): 6800,            # Singapore to Canada
+    ('SINGAPORE', 'MAP TA PHUT'): 763,           # Singapore to Thailand
+    ('SINGAPORE', 'XIAMEN'): 1650,               # Singapore to China
+    ('SINGAPORE', 'JINGTANG'): 2750,             # Singapore to China
+    ('SINGAPORE', 'JUBAIL'): 3900,               # Singapore to Saudi Arabia
+    ('SINGAPORE', 'PORT TALBOT'): 10500,         # Singapore to Wales
+
+    # -----------------------------------------------------------------
+    # FUJAIRAH (Middle East Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('FUJAIRAH', 'KAMSAR ANCHORAGE'): 6200,      # Fujairah to Guinea
+    ('FUJAIRAH', 'PORT HEDLAND'): 5300,          # Fujairah to Australia
+    ('FUJAIRAH', 'ITAGUAI'): 9800,               # Fujairah to Brazil
+    ('FUJAIRAH', 'TUBARAO'): 9900,               # Fujairah to Brazil
+    ('FUJAIRAH', 'DAMPIER'): 5400,               # Fujairah to Australia
+    ('FUJAIRAH', 'TABONEO'): 4600,               # Fujairah to Indonesia
+    ('FUJAIRAH', 'PONTA DA MADEIRA'): 10000,     # Fujairah to Brazil
+    ('FUJAIRAH', 'KRISHNAPATNAM'): 2900,         # Fujairah to India
+    ('FUJAIRAH', 'TELUK RUBIAH'): 3950,          # Fujairah to Malaysia
+    ('FUJAIRAH', 'MANGALORE'): 1900,             # Fujairah to India
+    ('FUJAIRAH', 'GWANGYANG'): 6800,             # Fujairah to S.Korea
+    ('FUJAIRAH', 'QINGDAO'): 6800,               # Fujairah to China
+    ('FUJAIRAH', 'SHANGHAI'): 6500,              # Fujairah to China
+    ('FUJAIRAH', 'FANGCHENG'): 5600,             # Fujairah to China
+    ('FUJAIRAH', 'CAOFEIDIAN'): 6950,            # Fujairah to China
+    ('FUJAIRAH', 'TIANJIN'): 7000,               # Fujairah to China
+    ('FUJAIRAH', 'LIANYUNGANG'): 6850,           # Fujairah to China
+    ('FUJAIRAH', 'PARADIP'): 2400,               # Fujairah to India
+    ('FUJAIRAH', 'MUNDRA'): 1100,                # Fujairah to India
+    ('FUJAIRAH', 'KANDLA'): 1000,                # Fujairah to India
+    ('FUJAIRAH', 'VIZAG'): 2650,                 # Fujairah to India
+    ('FUJAIRAH', 'SALDANHA BAY'): 5000,          # Fujairah to S.Africa
+    ('FUJAIRAH', 'ROTTERDAM'): 6800,             # Fujairah to Netherlands
+    ('FUJAIRAH', 'VANCOUVER'): 10500,            # Fujairah to Canada
+    ('FUJAIRAH', 'MAP TA PHUT'): 3400,           # Fujairah to Thailand
+    ('FUJAIRAH', 'XIAMEN'): 5900,                # Fujairah to China
+    ('FUJAIRAH', 'JINGTANG'): 7050,              # Fujairah to China
+    ('FUJAIRAH', 'JUBAIL'): 1050,                # Fujairah to Saudi Arabia
+    ('FUJAIRAH', 'PORT TALBOT'): 7800,           # Fujairah to Wales
+
+    # -----------------------------------------------------------------
+    # ROTTERDAM (NW Europe Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('ROTTERDAM', 'PORT HEDLAND'): 11500,        # Rotterdam to Australia
+    ('ROTTERDAM', 'ITAGUAI'): 6200,              # Rotterdam to Brazil
+    ('ROTTERDAM', 'TUBARAO'): 6300,              # Rotterdam to Brazil
+    ('ROTTERDAM', 'DAMPIER'): 11600,             # Rotterdam to Australia
+    ('ROTTERDAM', 'TABONEO'): 10100,             # Rotterdam to Indonesia
+    ('ROTTERDAM', 'PONTA DA MADEIRA'): 6400,     # Rotterdam to Brazil
+    ('ROTTERDAM', 'KRISHNAPATNAM'): 8900,        # Rotterdam to India
+    ('ROTTERDAM', 'TELUK RUBIAH'): 9600,         # Rotterdam to Malaysia
+    ('ROTTERDAM', 'MANGALORE'): 8200,            # Rotterdam to India
+    ('ROTTERDAM', 'GWANGYANG'): 12500,           # Rotterdam to S.Korea
+    ('ROTTERDAM', 'QINGDAO'): 12500,             # Rotterdam to China
+    ('ROTTERDAM', 'SHANGHAI'): 12200,            # Rotterdam to China
+    ('ROTTERDAM', 'FANGCHENG'): 11300,           # Rotterdam to China
+    ('ROTTERDAM', 'CAOFEIDIAN'): 12650,          # Rotterdam to China
+    ('ROTTERDAM', 'TIANJIN'): 12700,             # Rotterdam to China
+    ('ROTTERDAM', 'LIANYUNGANG'): 12550,         # Rotterdam to China
+    ('ROTTERDAM', 'PARADIP'): 8600,              # Rotterdam to India
+    ('ROTTERDAM', 'MUNDRA'): 7900,               # Rotterdam to India
+    ('ROTTERDAM', 'KANDLA'): 7800,               # Rotterdam to India
+    ('ROTTERDAM', 'VIZAG'): 8850,                # Rotterdam to India
+    ('ROTTERDAM', 'SALDANHA BAY'): 7000,         # Rotterdam to S.Africa
+    ('ROTTERDAM', 'VANCOUVER'): 7800,            # Rotterdam to Canada
+    ('ROTTERDAM', 'MAP TA PHUT'): 9900,          # Rotterdam to Thailand
+    ('ROTTERDAM', 'XIAMEN'): 11600,              # Rotterdam to China
+    ('ROTTERDAM', 'JINGTANG'): 12750,            # Rotterdam to China
+    ('ROTTERDAM', 'JUBAIL'): 6800,               # Rotterdam to Saudi Arabia
+    ('ROTTERDAM', 'PORT TALBOT'): 650,           # Rotterdam to Wales
+    ('ROTTERDAM', 'SINGAPORE'): 9200,            # Rotterdam to Singapore
+
+    # -----------------------------------------------------------------
+    # GIBRALTAR (Med/Atlantic Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('GIBRALTAR', 'KAMSAR ANCHORAGE'): 2500,     # Gibraltar to Guinea
+    ('GIBRALTAR', 'PORT HEDLAND'): 11200,        # Gibraltar to Australia
+    ('GIBRALTAR', 'ITAGUAI'): 5400,              # Gibraltar to Brazil
+    ('GIBRALTAR', 'TUBARAO'): 5500,              # Gibraltar to Brazil
+    ('GIBRALTAR', 'DAMPIER'): 11300,             # Gibraltar to Australia
+    ('GIBRALTAR', 'TABONEO'): 9600,              # Gibraltar to Indonesia
+    ('GIBRALTAR', 'PONTA DA MADEIRA'): 5600,     # Gibraltar to Brazil
+    ('GIBRALTAR', 'KRISHNAPATNAM'): 8200,        # Gibraltar to India
+    ('GIBRALTAR', 'TELUK RUBIAH'): 8900,         # Gibraltar to Malaysia
+    ('GIBRALTAR', 'MANGALORE'): 7500,            # Gibraltar to India
+    ('GIBRALTAR', 'GWANGYANG'): 12200,           # Gibraltar to S.Korea
+    ('GIBRALTAR', 'QINGDAO'): 12200,             # Gibraltar to China
+    ('GIBRALTAR', 'SHANGHAI'): 11900,            # Gibraltar to China
+    ('GIBRALTAR', 'FANGCHENG'): 11000,           # Gibraltar to China
+    ('GIBRALTAR', 'CAOFEIDIAN'): 12350,          # Gibraltar to China
+    ('GIBRALTAR', 'TIANJIN'): 12400,             # Gibraltar to China
+    ('GIBRALTAR', 'LIANYUNGANG'): 12250,         # Gibraltar to China
+    ('GIBRALTAR', 'PARADIP'): 7900,              # Gibraltar to India
+    ('GIBRALTAR', 'MUNDRA'): 7200,               # Gibraltar to India
+    ('GIBRALTAR', 'KANDLA'): 7100,               # Gibraltar to India
+    ('GIBRALTAR', 'VIZAG'): 8150,                # Gibraltar to India
+    ('GIBRALTAR', 'SALDANHA BAY'): 5800,         # Gibraltar to S.Africa
+    ('GIBRALTAR', 'ROTTERDAM'): 1750,            # Gibraltar to Netherlands
+    ('GIBRALTAR', 'VANCOUVER'): 8900,            # Gibraltar to Canada
+    ('GIBRALTAR', 'MAP TA PHUT'): 9200,          # Gibraltar to Thailand
+    ('GIBRALTAR', 'XIAMEN'): 11300,              # Gibraltar to China
+    ('GIBRALTAR', 'JINGTANG'): 12450,            # Gibraltar to China
+    ('GIBRALTAR', 'JUBAIL'): 6100,               # Gibraltar to Saudi Arabia
+    ('GIBRALTAR', 'PORT TALBOT'): 1450,          # Gibraltar to Wales
+    ('GIBRALTAR', 'SINGAPORE'): 8800,            # Gibraltar to Singapore
+
+    # -----------------------------------------------------------------
+    # DURBAN (Southern Africa Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('DURBAN', 'KAMSAR ANCHORAGE'): 5400,        # Durban to Guinea
+    ('DURBAN', 'PORT HEDLAND'): 5100,            # Durban to Australia
+    ('DURBAN', 'ITAGUAI'): 5800,                 # Durban to Brazil
+    ('DURBAN', 'TUBARAO'): 5900,                 # Durban to Brazil
+    ('DURBAN', 'DAMPIER'): 5200,                 # Durban to Australia
+    ('DURBAN', 'TABONEO'): 5850,                 # Durban to Indonesia
+    ('DURBAN', 'PONTA DA MADEIRA'): 6000,        # Durban to Brazil
+    ('DURBAN', 'KRISHNAPATNAM'): 3700,           # Durban to India
+    ('DURBAN', 'TELUK RUBIAH'): 4900,            # Durban to Malaysia
+    ('DURBAN', 'MANGALORE'): 3400,               # Durban to India
+    ('DURBAN', 'GWANGYANG'): 7400,               # Durban to S.Korea
+    ('DURBAN', 'QINGDAO'): 7400,                 # Durban to China
+    ('DURBAN', 'SHANGHAI'): 7100,                # Durban to China
+    ('DURBAN', 'FANGCHENG'): 6200,               # Durban to China
+    ('DURBAN', 'CAOFEIDIAN'): 7550,              # Durban to China
+    ('DURBAN', 'TIANJIN'): 7600,                 # Durban to China
+    ('DURBAN', 'LIANYUNGANG'): 7450,             # Durban to China
+    ('DURBAN', 'PARADIP'): 3500,                 # Durban to India
+    ('DURBAN', 'MUNDRA'): 3200,                  # Durban to India
+    ('DURBAN', 'KANDLA'): 3100,                  # Durban to India
+    ('DURBAN', 'VIZAG'): 3750,                   # Durban to India
+    ('DURBAN', 'SALDANHA BAY'): 850,             # Durban to S.Africa
+    ('DURBAN', 'ROTTERDAM'): 7000,               # Durban to Netherlands
+    ('DURBAN', 'VANCOUVER'): 12200,              # Durban to Canada
+    ('DURBAN', 'MAP TA PHUT'): 4700,             # Durban to Thailand
+    ('DURBAN', 'XIAMEN'): 6500,                  # Durban to China
+    ('DURBAN', 'JINGTANG'): 7650,                # Durban to China
+    ('DURBAN', 'JUBAIL'): 4000,                  # Durban to Saudi Arabia
+    ('DURBAN', 'PORT TALBOT'): 7700,             # Durban to Wales
+    ('DURBAN', 'SINGAPORE'): 4900,               # Durban to Singapore
+
+    # -----------------------------------------------------------------
+    # QINGDAO (China Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('QINGDAO', 'KAMSAR ANCHORAGE'): 11800,      # Qingdao to Guinea
+    ('QINGDAO', 'PORT HEDLAND'): 3300,           # Qingdao to Australia
+    ('QINGDAO', 'ITAGUAI'): 12200,               # Qingdao to Brazil
+    ('QINGDAO', 'TUBARAO'): 12100,               # Qingdao to Brazil
+    ('QINGDAO', 'DAMPIER'): 3400,                # Qingdao to Australia
+    ('QINGDAO', 'PONTA DA MADEIRA'): 12300,      # Qingdao to Brazil
+    ('QINGDAO', 'KRISHNAPATNAM'): 3050,          # Qingdao to India
+    ('QINGDAO', 'TELUK RUBIAH'): 2350,           # Qingdao to Malaysia
+    ('QINGDAO', 'MANGALORE'): 3450,              # Qingdao to India
+    ('QINGDAO', 'GWANGYANG'): 520,               # Qingdao to S.Korea
+    ('QINGDAO', 'SHANGHAI'): 380,                # Qingdao to China
+    ('QINGDAO', 'FANGCHENG'): 1420,              # Qingdao to China
+    ('QINGDAO', 'CAOFEIDIAN'): 280,              # Qingdao to China
+    ('QINGDAO', 'TIANJIN'): 330,                 # Qingdao to China
+    ('QINGDAO', 'LIANYUNGANG'): 180,             # Qingdao to China
+    ('QINGDAO', 'PARADIP'): 3150,                # Qingdao to India
+    ('QINGDAO', 'MUNDRA'): 3700,                 # Qingdao to India
+    ('QINGDAO', 'KANDLA'): 3800,                 # Qingdao to India
+    ('QINGDAO', 'VIZAG'): 3000,                  # Qingdao to India
+    ('QINGDAO', 'SALDANHA BAY'): 8800,           # Qingdao to S.Africa
+    ('QINGDAO', 'ROTTERDAM'): 12500,             # Qingdao to Netherlands
+    ('QINGDAO', 'VANCOUVER'): 5200,              # Qingdao to Canada
+    ('QINGDAO', 'MAP TA PHUT'): 2000,            # Qingdao to Thailand
+    ('QINGDAO', 'XIAMEN'): 850,                  # Qingdao to China
+    ('QINGDAO', 'JINGTANG'): 240,                # Qingdao to China
+    ('QINGDAO', 'JUBAIL'): 6800,                 # Qingdao to Saudi Arabia
+    ('QINGDAO', 'PORT TALBOT'): 13200,           # Qingdao to Wales
+    ('QINGDAO', 'SINGAPORE'): 2460,              # Qingdao to Singapore
+    ('QINGDAO', 'FUJAIRAH'): 6800,               # Qingdao to Fujairah
+
+    # -----------------------------------------------------------------
+    # SHANGHAI (China Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('SHANGHAI', 'KAMSAR ANCHORAGE'): 12200,     # Shanghai to Guinea
+    ('SHANGHAI', 'PORT HEDLAND'): 3238,          # Shanghai to Australia
+    ('SHANGHAI', 'ITAGUAI'): 12100,              # Shanghai to Brazil
+    ('SHANGHAI', 'TUBARAO'): 12000,              # Shanghai to Brazil
+    ('SHANGHAI', 'DAMPIER'): 3350,               # Shanghai to Australia
+    ('SHANGHAI', 'TABONEO'): 1900,               # Shanghai to Indonesia
+    ('SHANGHAI', 'PONTA DA MADEIRA'): 12200,     # Shanghai to Brazil
+    ('SHANGHAI', 'KRISHNAPATNAM'): 2950,         # Shanghai to India
+    ('SHANGHAI', 'TELUK RUBIAH'): 2100,          # Shanghai to Malaysia
+    ('SHANGHAI', 'MANGALORE'): 3350,             # Shanghai to India
+    ('SHANGHAI', 'GWANGYANG'): 490,              # Shanghai to S.Korea
+    ('SHANGHAI', 'QINGDAO'): 380,                # Shanghai to China
+    ('SHANGHAI', 'FANGCHENG'): 1100,             # Shanghai to China
+    ('SHANGHAI', 'CAOFEIDIAN'): 520,             # Shanghai to China
+    ('SHANGHAI', 'TIANJIN'): 570,                # Shanghai to China
+    ('SHANGHAI', 'LIANYUNGANG'): 240,            # Shanghai to China
+    ('SHANGHAI', 'PARADIP'): 3050,               # Shanghai to India
+    ('SHANGHAI', 'MUNDRA'): 3600,                # Shanghai to India
+    ('SHANGHAI', 'KANDLA'): 3700,                # Shanghai to India
+    ('SHANGHAI', 'VIZAG'): 2900,                 # Shanghai to India
+    ('SHANGHAI', 'SALDANHA BAY'): 9200,          # Shanghai to S.Africa
+    ('SHANGHAI', 'ROTTERDAM'): 12200,            # Shanghai to Netherlands
+    ('SHANGHAI', 'VANCOUVER'): 5400,             # Shanghai to Canada
+    ('SHANGHAI', 'MAP TA PHUT'): 1750,           # Shanghai to Thailand
+    ('SHANGHAI', 'XIAMEN'): 420,                 # Shanghai to China
+    ('SHANGHAI', 'JINGTANG'): 480,               # Shanghai to China
+    ('SHANGHAI', 'JUBAIL'): 6500,                # Shanghai to Saudi Arabia
+    ('SHANGHAI', 'PORT TALBOT'): 12900,          # Shanghai to Wales
+    ('SHANGHAI', 'SINGAPORE'): 2200,             # Shanghai to Singapore
+    ('SHANGHAI', 'FUJAIRAH'): 6500,              # Shanghai to Fujairah
+
+    # -----------------------------------------------------------------
+    # PORT LOUIS (Indian Ocean Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('PORT LOUIS', 'KAMSAR ANCHORAGE'): 5600,    # Port Louis to Guinea
+    ('PORT LOUIS', 'PORT HEDLAND'): 3600,        # Port Louis to Australia
+    ('PORT LOUIS', 'ITAGUAI'): 6600,             # Port Louis to Brazil
+    ('PORT LOUIS', 'TUBARAO'): 6700,             # Port Louis to Brazil
+    ('PORT LOUIS', 'DAMPIER'): 3700,             # Port Louis to Australia
+    ('PORT LOUIS', 'TABONEO'): 3900,             # Port Louis to Indonesia
+    ('PORT LOUIS', 'PONTA DA MADEIRA'): 6800,    # Port Louis to Brazil
+    ('PORT LOUIS', 'KRISHNAPATNAM'): 2400,       # Port Louis to India
+    ('PORT LOUIS', 'TELUK RUBIAH'): 3300,        # Port Louis to Malaysia
+    ('PORT LOUIS', 'MANGALORE'): 2100,           # Port Louis to India
+    ('PORT LOUIS', 'GWANGYANG'): 5900,           # Port Louis to S.Korea
+    ('PORT LOUIS', 'QINGDAO'): 5900,             # Port Louis to China
+    ('PORT LOUIS', 'SHANGHAI'): 5600,            # Port Louis to China
+    ('PORT LOUIS', 'FANGCHENG'): 4700,           # Port Louis to China
+    ('PORT LOUIS', 'CAOFEIDIAN'): 6050,          # Port Louis to China
+    ('PORT LOUIS', 'TIANJIN'): 6100,             # Port Louis to China
+    ('PORT LOUIS', 'LIANYUNGANG'): 5950,         # Port Louis to China
+    ('PORT LOUIS', 'PARADIP'): 2200,             # Port Louis to India
+    ('PORT LOUIS', 'MUNDRA'): 1900,              # Port Louis to India
+    ('PORT LOUIS', 'KANDLA'): 1800,              # Port Louis to India
+    ('PORT LOUIS', 'VIZAG'): 2450,               # Port Louis to India
+    ('PORT LOUIS', 'SALDANHA BAY'): 1950,        # Port Louis to S.Africa
+    ('PORT LOUIS', 'ROTTERDAM'): 7800,           # Port Louis to Netherlands
+    ('PORT LOUIS', 'VANCOUVER'): 10800,          # Port Louis to Canada
+    ('PORT LOUIS', 'MAP TA PHUT'): 3200,         # Port Louis to Thailand
+    ('PORT LOUIS', 'XIAMEN'): 5000,              # Port Louis to China
+    ('PORT LOUIS', 'JINGTANG'): 6150,            # Port Louis to China
+    ('PORT LOUIS', 'JUBAIL'): 2700,              # Port Louis to Saudi Arabia
+    ('PORT LOUIS', 'PORT TALBOT'): 8500,         # Port Louis to Wales
+    ('PORT LOUIS', 'SINGAPORE'): 3300,           # Port Louis to Singapore
+    ('PORT LOUIS', 'FUJAIRAH'): 2500,            # Port Louis to Fujairah
+
+    # -----------------------------------------------------------------
+    # RICHARDS BAY (South African Hub) - to major load ports
+    # -----------------------------------------------------------------
+    ('RICHARDS BAY', 'KAMSAR ANCHORAGE'): 5600,  # Richards Bay to Guinea
+    ('RICHARDS BAY', 'PORT HEDLAND'): 5300,      # Richards Bay to Australia
+    ('RICHARDS BAY', 'ITAGUAI'): 6000,           # Richards Bay to Brazil
+    ('RICHARDS BAY', 'TUBARAO'): 6100,           # Richards Bay to Brazil
+    ('RICHARDS BAY', 'DAMPIER'): 5400,           # Richards Bay to Australia
+    ('RICHARDS BAY', 'TABONEO'): 6050,           # Richards Bay to Indonesia
+    ('RICHARDS BAY', 'PONTA DA MADEIRA'): 6200,  # Richards Bay to Brazil
+    ('RICHARDS BAY', 'KRISHNAPATNAM'): 3900,     # Richards Bay to India
+    ('RICHARDS BAY', 'TELUK RUBIAH'): 5100,      # Richards Bay to Malaysia
+    ('RICHARDS BAY', 'MANGALORE'): 3600,         # Richards Bay to India
+    ('RICHARDS BAY', 'GWANGYANG'): 7600,         # Richards Bay to S.Korea
+    ('RICHARDS BAY', 'QINGDAO'): 7600,           # Richards Bay to China
+    ('RICHARDS BAY', 'SHANGHAI'): 7300,          # Richards Bay to China
+    ('RICHARDS BAY', 'FANGCHENG'): 6400,         # Richards Bay to China
+    ('RICHARDS BAY', 'CAOFEIDIAN'): 7750,        # Richards Bay to China
+    ('RICHARDS BAY', 'TIANJIN'): 7800,           # Richards Bay to China
+    ('RICHARDS BAY', 'LIANYUNGANG'): 7650,       # Richards Bay to China
+    ('RICHARDS BAY', 'PARADIP'): 3700,           # Richards Bay to India
+    ('RICHARDS BAY', 'MUNDRA'): 3400,            # Richards Bay to India
+    ('RICHARDS BAY', 'KANDLA'): 3300,            # Richards Bay to India
+    ('RICHARDS BAY', 'VIZAG'): 3950,             # Richards Bay to India
+    ('RICHARDS BAY', 'SALDANHA BAY'): 900,       # Richards Bay to S.Africa
+    ('RICHARDS BAY', 'ROTTERDAM'): 7200,         # Richards Bay to Netherlands
+    ('RICHARDS BAY', 'VANCOUVER'): 12400,        # Richards Bay to Canada
+    ('RICHARDS BAY', 'MAP TA PHUT'): 4900,       # Richards Bay to Thailand
+    ('RICHARDS BAY', 'XIAMEN'): 6700,            # Richards Bay to China
+    ('RICHARDS BAY', 'JINGTANG'): 7850,          # Richards Bay to China
+    ('RICHARDS BAY', 'JUBAIL'): 4200,            # Richards Bay to Saudi Arabia
+    ('RICHARDS BAY', 'PORT TALBOT'): 7900,       # Richards Bay to Wales
+    ('RICHARDS BAY', 'SINGAPORE'): 5100,         # Richards Bay to Singapore
+    ('RICHARDS BAY', 'FUJAIRAH'): 4100,          # Richards Bay to Fujairah
+
+    # =================================================================
+    # VESSEL CURRENT POSITIONS TO BUNKER PORTS
+    # =================================================================
+    # Common vessel positions to bunker ports for the first leg of
+    # bunker routing (vessel_current_port -> bunker_port)
+    # =================================================================
+
+    # MAP TA PHUT (common vessel position) to bunker ports
+    ('MAP TA PHUT', 'SINGAPORE'): 763,           # Thailand to Singapore
+    ('MAP TA PHUT', 'FUJAIRAH'): 3400,           # Thailand to Fujairah
+    ('MAP TA PHUT', 'ROTTERDAM'): 9900,          # Thailand to Rotterdam
+    ('MAP TA PHUT', 'GIBRALTAR'): 9200,          # Thailand to Gibraltar
+    ('MAP TA PHUT', 'DURBAN'): 4700,             # Thailand to Durban
+    ('MAP TA PHUT', 'QINGDAO'): 2000,            # Thailand to Qingdao
+    ('MAP TA PHUT', 'SHANGHAI'): 1750,           # Thailand to Shanghai
+    ('MAP TA PHUT', 'PORT LOUIS'): 3200,         # Thailand to Port Louis
+    ('MAP TA PHUT', 'RICHARDS BAY'): 4900,       # Thailand to Richards Bay
+
+    # GWANGYANG (common vessel position) to bunker ports
+    ('GWANGYANG', 'SINGAPORE'): 2460,            # S.Korea to Singapore
+    ('GWANGYANG', 'FUJAIRAH'): 6800,             # S.Korea to Fujairah
+    ('GWANGYANG', 'ROTTERDAM'): 12500,           # S.Korea to Rotterdam
+    ('GWANGYANG', 'GIBRALTAR'): 12200,           # S.Korea to Gibraltar
+    ('GWANGYANG', 'DURBAN'): 7400,               # S.Korea to Durban
+    ('GWANGYANG', 'QINGDAO'): 520,               # S.Korea to Qingdao
+    ('GWANGYANG', 'SHANGHAI'): 490,              # S.Korea to Shanghai
+    ('GWANGYANG', 'PORT LOUIS'): 5900,           # S.Korea to Port Louis
+    ('GWANGYANG', 'RICHARDS BAY'): 7600,         # S.Korea to Richards Bay
+
+    # PORT TALBOT (common vessel position) to bunker ports
+    ('PORT TALBOT', 'SINGAPORE'): 10500,         # Wales to Singapore
+    ('PORT TALBOT', 'FUJAIRAH'): 7800,           # Wales to Fujairah
+    ('PORT TALBOT', 'ROTTERDAM'): 650,           # Wales to Rotterdam
+    ('PORT TALBOT', 'GIBRALTAR'): 1450,          # Wales to Gibraltar
+    ('PORT TALBOT', 'DURBAN'): 7700,             # Wales to Durban
+    ('PORT TALBOT', 'QINGDAO'): 13200,           # Wales to Qingdao
+    ('PORT TALBOT', 'SHANGHAI'): 12900,          # Wales to Shanghai
+    ('PORT TALBOT', 'PORT LOUIS'): 8500,         # Wales to Port Louis
+    ('PORT TALBOT', 'RICHARDS BAY'): 7900,       # Wales to Richards Bay
+
+    # JUBAIL (common vessel position) to bunker ports
+    ('JUBAIL', 'SINGAPORE'): 3900,               # Saudi Arabia to Singapore
+    ('JUBAIL', 'FUJAIRAH'): 1050,                # Saudi Arabia to Fujairah
+    ('JUBAIL', 'ROTTERDAM'): 6800,               # Saudi Arabia to Rotterdam
+    ('JUBAIL', 'GIBRALTAR'): 6100,               # Saudi Arabia to Gibraltar
+    ('JUBAIL', 'DURBAN'): 4000,                  # Saudi Arabia to Durban
+    ('JUBAIL', 'QINGDAO'): 6800,                 # Saudi Arabia to Qingdao
+    ('JUBAIL', 'SHANGHAI'): 6500,                # Saudi Arabia to Shanghai
+    ('JUBAIL', 'PORT LOUIS'): 2700,              # Saudi Arabia to Port Louis
+    ('JUBAIL', 'RICHARDS BAY'): 4200,            # Saudi Arabia to Richards Bay
+
+    # PARADIP (common vessel position) to bunker ports
+    ('PARADIP', 'SINGAPORE'): 1950,              # India to Singapore
+    ('PARADIP', 'FUJAIRAH'): 2400,               # India to Fujairah
+    ('PARADIP', 'ROTTERDAM'): 8600,              # India to Rotterdam
+    ('PARADIP', 'GIBRALTAR'): 7900,              # India to Gibraltar
+    ('PARADIP', 'DURBAN'): 3500,                 # India to Durban
+    ('PARADIP', 'QINGDAO'): 3150,                # India to Qingdao
+    ('PARADIP', 'SHANGHAI'): 3050,               # India to Shanghai
+    ('PARADIP', 'PORT LOUIS'): 2200,             # India to Port Louis
+    ('PARADIP', 'RICHARDS BAY'): 3700,           # India to Richards Bay
+
+    # QINGDAO (common vessel position) to bunker ports
+    ('QINGDAO', 'SINGAPORE'): 2460,              # China to Singapore
+    ('QINGDAO', 'ROTTERDAM'): 12500,             # China to Rotterdam
+    ('QINGDAO', 'GIBRALTAR'): 12200,             # China to Gibraltar
+    ('QINGDAO', 'DURBAN'): 7400,                 # China to Durban
+    ('QINGDAO', 'SHANGHAI'): 380,                # China to Shanghai
+    ('QINGDAO', 'PORT LOUIS'): 5900,             # China to Port Louis
+    ('QINGDAO', 'RICHARDS BAY'): 7600,           # China to Richards Bay
+
+    # XIAMEN (common vessel position) to bunker ports
+    ('XIAMEN', 'SINGAPORE'): 1650,               # China to Singapore
+    ('XIAMEN', 'FUJAIRAH'): 5900,                # China to Fujairah
+    ('XIAMEN', 'ROTTERDAM'): 11600,              # China to Rotterdam
+    ('XIAMEN', 'GIBRALTAR'): 11300,              # China to Gibraltar
+    ('XIAMEN', 'DURBAN'): 6500,                  # China to Durban
+    ('XIAMEN', 'QINGDAO'): 850,                  # China to Qingdao
+    ('XIAMEN', 'SHANGHAI'): 420,                 # China to Shanghai
+    ('XIAMEN', 'PORT LOUIS'): 5000,              # China to Port Louis
+    ('XIAMEN', 'RICHARDS BAY'): 6700,            # China to Richards Bay
+
+    # FANGCHENG (common vessel position) to bunker ports
+    ('FANGCHENG', 'SINGAPORE'): 1300,            # China to Singapore
+    ('FANGCHENG', 'FUJAIRAH'): 5600,             # China to Fujairah
+    ('FANGCHENG', 'ROTTERDAM'): 11300,           # China to Rotterdam
+    ('FANGCHENG', 'GIBRALTAR'): 11000,           # China to Gibraltar
+    ('FANGCHENG', 'DURBAN'): 6200,               # China to Durban
+    ('FANGCHENG', 'QINGDAO'): 1420,              # China to Qingdao
+    ('FANGCHENG', 'SHANGHAI'): 1100,             # China to Shanghai
+    ('FANGCHENG', 'PORT LOUIS'): 4700,           # China to Port Louis
+    ('FANGCHENG', 'RICHARDS BAY'): 6400,         # China to Richards Bay
+
+    # TIANJIN (common vessel position) to bunker ports
+    ('TIANJIN', 'SINGAPORE'): 2700,              # China to Singapore
+    ('TIANJIN', 'FUJAIRAH'): 7000,               # China to Fujairah
+    ('TIANJIN', 'ROTTERDAM'): 12700,             # China to Rotterdam
+    ('TIANJIN', 'GIBRALTAR'): 12400,             # China to Gibraltar
+    ('TIANJIN', 'DURBAN'): 7600,                 # China to Durban
+    ('TIANJIN', 'QINGDAO'): 330,                 # China to Qingdao
+    ('TIANJIN', 'SHANGHAI'): 570,                # China to Shanghai
+    ('TIANJIN', 'PORT LOUIS'): 6100,             # China to Port Louis
+    ('TIANJIN', 'RICHARDS BAY'): 7800,           # China to Richards Bay
+
+    # VIZAG (common vessel position) to bunker ports
+    ('VIZAG', 'SINGAPORE'): 1900,                # India to Singapore
+    ('VIZAG', 'FUJAIRAH'): 2650,                 # India to Fujairah
+    ('VIZAG', 'ROTTERDAM'): 8850,                # India to Rotterdam
+    ('VIZAG', 'GIBRALTAR'): 8150,                # India to Gibraltar
+    ('VIZAG', 'DURBAN'): 3750,                   # India to Durban
+    ('VIZAG', 'QINGDAO'): 3000,                  # India to Qingdao
+    ('VIZAG', 'SHANGHAI'): 2900,                 # India to Shanghai
+    ('VIZAG', 'PORT LOUIS'): 2450,               # India to Port Louis
+    ('VIZAG', 'RICHARDS BAY'): 3950,             # India to Richards Bay
+
+    # MUNDRA (common vessel position) to bunker ports
+    ('MUNDRA', 'SINGAPORE'): 2400,               # India to Singapore
+    ('MUNDRA', 'FUJAIRAH'): 1100,                # India to Fujairah
+    ('MUNDRA', 'ROTTERDAM'): 7900,               # India to Rotterdam
+    ('MUNDRA', 'GIBRALTAR'): 7200,               # India to Gibraltar
+    ('MUNDRA', 'DURBAN'): 3200,                  # India to Durban
+    ('MUNDRA', 'QINGDAO'): 3700,                 # India to Qingdao
+    ('MUNDRA', 'SHANGHAI'): 3600,                # India to Shanghai
+    ('MUNDRA', 'PORT LOUIS'): 1900,              # India to Port Louis
+    ('MUNDRA', 'RICHARDS BAY'): 3400,            # India to Richards Bay
+
+    # KANDLA (common vessel position) to bunker ports
+    ('KANDLA', 'SINGAPORE'): 2500,               # India to Singapore
+    ('KANDLA', 'FUJAIRAH'): 1000,                # India to Fujairah
+    ('KANDLA', 'ROTTERDAM'): 7800,               # India to Rotterdam
+    ('KANDLA', 'GIBRALTAR'): 7100,               # India to Gibraltar
+    ('KANDLA', 'DURBAN'): 3100,                  # India to Durban
+    ('KANDLA', 'QINGDAO'): 3800,                 # India to Qingdao
+    ('KANDLA', 'SHANGHAI'): 3700,                # India to Shanghai
+    ('KANDLA', 'PORT LOUIS'): 1800,              # India to Port Louis
+    ('KANDLA', 'RICHARDS BAY'): 3300,            # India to Richards Bay
+
+    # ROTTERDAM (common vessel position) to bunker ports
+    ('ROTTERDAM', 'SINGAPORE'): 9200,            # Netherlands to Singapore
+    ('ROTTERDAM', 'FUJAIRAH'): 6800,             # Netherlands to Fujairah
+    ('ROTTERDAM', 'GIBRALTAR'): 1750,            # Netherlands to Gibraltar
+    ('ROTTERDAM', 'DURBAN'): 7000,               # Netherlands to Durban
+    ('ROTTERDAM', 'QINGDAO'): 12500,             # Netherlands to Qingdao
+    ('ROTTERDAM', 'SHANGHAI'): 12200,            # Netherlands to Shanghai
+    ('ROTTERDAM', 'PORT LOUIS'): 7800,           # Netherlands to Port Louis
+    ('ROTTERDAM', 'RICHARDS BAY'): 7200,         # Netherlands to Richards Bay
+
+    # SALDANHA BAY (common vessel position) to bunker ports
+    ('SALDANHA BAY', 'SINGAPORE'): 5600,         # S.Africa to Singapore
+    ('SALDANHA BAY', 'FUJAIRAH'): 5000,          # S.Africa to Fujairah
+    ('SALDANHA BAY', 'ROTTERDAM'): 7000,         # S.Africa to Rotterdam
+    ('SALDANHA BAY', 'GIBRALTAR'): 5800,         # S.Africa to Gibraltar
+    ('SALDANHA BAY', 'DURBAN'): 850,             # S.Africa to Durban
+    ('SALDANHA BAY', 'QINGDAO'): 8800,           # S.Africa to Qingdao
+    ('SALDANHA BAY', 'SHANGHAI'): 9200,          # S.Africa to Shanghai
+    ('SALDANHA BAY', 'PORT LOUIS'): 1950,        # S.Africa to Port Louis
+    ('SALDANHA BAY', 'RICHARDS BAY'): 900,       # S.Africa to Richards Bay
+}
+
+
+def _read_port_distances(csv_path: str) -> Tuple[List[str], List[str], List[float]]:
+    """
+    Read Port_Distances.csv into (from_ports, to_ports, distances) lists.
+
+    Port names are uppercased. Uses pyarrow's CSV reader over a memory-mapped
+    file when available (the three columns go straight to Python lists, no
+    DataFrame, vectorized utf8_upper), otherwise falls back to the stdlib csv
+    module, which beats pandas for a flat three-column file.
+    """
+    if HAS_PYARROW:
+        table = pacsv.read_csv(
+            pa.memory_map(csv_path, 'r'),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=['PORT_NAME_FROM', 'PORT_NAME_TO', 'DISTANCE'],
+                column_types={'DISTANCE': pa.float64()},
+            ),
+        )
+        return (
+            pc.utf8_upper(table['PORT_NAME_FROM']).to_pylist(),
+            pc.utf8_upper(table['PORT_NAME_TO']).to_pylist(),
+            table['DISTANCE'].to_pylist(),
+        )
+
+    frm, to, dist = [], [], []
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_from = header.index('PORT_NAME_FROM')
+        i_to = header.index('PORT_NAME_TO')
+        i_dist = header.index('DISTANCE')
+        for row in reader:
+            frm.append(row[i_from].upper())
+            to.append(row[i_to].upper())
+            dist.append(float(row[i_dist]))
+    return frm, to, dist
+
+
+@functools.cache
+def _estimate_index() -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                               Mapping[int, int], Mapping[str, int]]:
+    """
+    Build the normalized estimated-distance index once per process.
+
+    Struct-of-arrays: small int port ids, parallel from/to/distance arrays,
+    and a packed (from_id << 16 | to_id) -> row index. Both directions are
+    stored. Returned arrays and mappings are read-only and shared by every
+    PortDistanceManager.
+    """
+    est_ports = sorted({p.upper() for pair in _ESTIMATED_DISTANCES for p in pair})
+    est_port_id = {sys.intern(p): i for i, p in enumerate(est_ports)}
+    est_from, est_to, est_dist = [], [], []
+    for (port_from, port_to), distance in _ESTIMATED_DISTANCES.items():
+        fi = est_port_id[port_from.upper()]
+        ti = est_port_id[port_to.upper()]
+        est_from += [fi, ti]
+        est_to += [ti, fi]
+        est_dist += [distance, distance]
+    from_arr = np.array(est_from, dtype=np.uint16)
+    to_arr = np.array(est_to, dtype=np.uint16)
+    # Estimates are whole nautical miles well under 65,535, so uint16 is
+    # lossless here (CSV distances are fractional and stay float)
+    dist_arr = np.array(est_dist, dtype=np.uint16)
+    for arr in (from_arr, to_arr, dist_arr):
+        arr.flags.writeable = False
+    # Later entries win on duplicate pairs, as with the old dict build
+    index = {(fi << 16) | ti: row for row, (fi, ti) in enumerate(zip(est_from, est_to))}
+    return (from_arr, to_arr, dist_arr,
+            MappingProxyType(index), MappingProxyType(est_port_id))
+
+
+# Shared empty row for nested-dict misses (never mutated)
+_EMPTY_ROW: Dict[str, float] = {}
+
+
 class PortDistanceManager:
     """
     Manages port-to-port distance lookups with fuzzy matching.
@@ -255,667 +1054,160 @@ class PortDistanceManager:
     3. Estimated distances (hardcoded fallback)
 
     Logging:
-    - INFO: When estimated distances are used
+    - INFO: When estimated distances are used (verbose=True only;
+      otherwise usage is only aggregated in the lookup stats)
     - WARNING: When no distance is found
     """
 
+    __slots__ = (
+        'verbose', 'distances', '_routes', '_lookup_stats', '_estimate_usage',
+        'port_aliases', 'estimated_distances', '_alias_group',
+        '_est_port_id', '_est_from', '_est_to', '_est_dist', '_est_index',
+        '_port_id', '_dense', '_resolve_cached', '_upper_cache', '_ports_in_csv',
+    )
+
     def __init__(self, csv_path: str = 'Port_Distances.csv', verbose: bool = False):
         self.verbose = verbose
-        self.df = pd.read_csv(csv_path)
-        self.df['PORT_NAME_FROM'] = self.df['PORT_NAME_FROM'].str.upper()
-        self.df['PORT_NAME_TO'] = self.df['PORT_NAME_TO'].str.upper()
 
-        # Build lookup dict for speed
-        self.distances = {}
-        for _, row in self.df.iterrows():
-            key = (row['PORT_NAME_FROM'], row['PORT_NAME_TO'])
-            self.distances[key] = row['DISTANCE']
+        # Build nested lookup dict for speed: distances[FROM][TO] -> nm.
+        # Port names are interned so repeated lookups hash/compare cheaply.
+        frm, to, dist = _read_port_distances(csv_path)
+        self.distances: Dict[str, Dict[str, float]] = {}
+        for f, t, d in zip(frm, to, dist):
+            self.distances.setdefault(sys.intern(f), {})[sys.intern(t)] = d
+
+        # Fold reverse direction into one route table so each (f, t) probe is a
+        # single dict.get: routes[f][t] -> (distance, source, matched_from, matched_to).
+        # Direct CSV entries win over reverse ones, matching the old probe order.
+        self._routes: Dict[str, Dict[str, Tuple[float, str, str, str]]] = {}
+        for f, row in self.distances.items():
+            for t, d in row.items():
+                self._routes.setdefault(f, {})[t] = (d, DistanceSource.CSV, f, t)
+        for f, row in self.distances.items():
+            for t, d in row.items():
+                self._routes.setdefault(t, {}).setdefault(f, (d, DistanceSource.CSV_REVERSE, f, t))
+
+        # Every port with at least one CSV route (either direction)
+        self._ports_in_csv = frozenset(self._routes)
+
+        # Route table, port set and dense matrix derive from this; freeze it
+        self.distances = MappingProxyType(self.distances)
 
         # Track usage statistics
-        self._lookup_stats = {'csv': 0, 'csv_reverse': 0, 'estimate': 0, 'not_found': 0}
-        self._estimate_usage = {}  # Track which estimates are actually used
-
-        # Port name mapping for common variations
-        self.port_aliases = {
-            'QINGDAO': ['QINGDAO', 'DAGANG (QINGDAO)'],
-            'KAMSAR': ['KAMSAR ANCHORAGE', 'PORT KAMSAR'],
-            'KAMSAR ANCHORAGE': ['KAMSAR ANCHORAGE', 'PORT KAMSAR'],  # Allow both directions
-            'SINGAPORE': ['SINGAPORE'],
-            'PORT HEDLAND': ['PORT HEDLAND'],
-            'ITAGUAI': ['ITAGUAI'],
-            'TUBARAO': ['TUBARAO'],
-            'GWANGYANG': ['GWANGYANG LNG TERMINAL', 'GWANGYANG'],
-            'FANGCHENG': ['FANGCHENG'],
-            'MAP TA PHUT': ['MAP TA PHUT'],
-            'DAMPIER': ['DAMPIER'],
-            'SALDANHA BAY': ['SALDANHA BAY'],
-            'ROTTERDAM': ['ROTTERDAM'],
-            'CAOFEIDIAN': ['CAOFEIDIAN'],
-            'LIANYUNGANG': ['LIANYUNGANG'],
-            'PARADIP': ['PARADIP'],
-            'MUNDRA': ['MUNDRA'],
-            'KANDLA': ['KANDLA'],
-            'PONTA DA MADEIRA': ['PONTA DA MADEIRA', 'SAO LUIS'],
-            'TIANJIN': ['TIANJIN', 'XINGANG'],
-            'TABONEO': ['TABONEO'],
-            'KRISHNAPATNAM': ['KRISHNAPATNAM'],
-            'VANCOUVER': ['VANCOUVER', 'VANCOUVER (CANADA)'],  # Added CSV variant
-            'MANGALORE': ['MANGALORE', 'NEW MANGALORE'],
-            'TELUK RUBIAH': ['TELUK RUBIAH'],
-            'PORT TALBOT': ['PORT TALBOT'],
-            'XIAMEN': ['XIAMEN'],
-            'JINGTANG': ['JINGTANG'],
-            'VIZAG': ['VIZAG', 'VISAKHAPATNAM'],
-            'JUBAIL': ['JUBAIL'],
-            'SHANGHAI': ['SHANGHAI'],
-            # Bunker port aliases
-            'FUJAIRAH': ['FUJAIRAH'],
-            'GIBRALTAR': ['GIBRALTAR'],
-            'DURBAN': ['DURBAN'],
-            'PORT LOUIS': ['PORT LOUIS'],
-            'RICHARDS BAY': ['RICHARDS BAY'],
-        }
-        
-        # =================================================================
-        # ESTIMATED DISTANCES - Only for routes NOT in Port_Distances.csv
-        # =================================================================
-        # These are fallback estimates used ONLY when CSV lookup fails.
-        # CSV lookup takes priority and should cover most routes.
-        #
-        # NOTE: Estimates were validated against CSV on 2026-01-25.
-        #       Routes that exist in CSV have been removed.
-        #       Remaining estimates are for routes truly missing from CSV.
-        # =================================================================
-
-        self.estimated_distances = {
-            # -----------------------------------------------------------------
-            # MAP TA PHUT (Thailand) - Limited coverage in CSV
-            # Vessel: OCEAN HORIZON starts here
-            # -----------------------------------------------------------------
-            ('MAP TA PHUT', 'PORT HEDLAND'): 2800,       # ~9.3 days at 12.5 kn
-            ('MAP TA PHUT', 'KAMSAR ANCHORAGE'): 9500,   # ~31.7 days at 12.5 kn
-            ('MAP TA PHUT', 'ITAGUAI'): 12500,           # ~41.7 days at 12.5 kn
-            ('MAP TA PHUT', 'DAMPIER'): 2700,            # Similar to Port Hedland
-            ('MAP TA PHUT', 'TUBARAO'): 12600,           # Similar to Itaguai
-            ('MAP TA PHUT', 'SALDANHA BAY'): 6800,       # Via Indian Ocean
-
-            # -----------------------------------------------------------------
-            # GWANGYANG (S. Korea) - CSV only has LNG Terminal variant
-            # Vessel: PACIFIC GLORY, MOUNTAIN TRADER start here
-            # Note: PORT HEDLAND route exists via GWANGYANG LNG TERMINAL alias
-            # -----------------------------------------------------------------
-            ('GWANGYANG', 'KAMSAR ANCHORAGE'): 11500,    # ~38.3 days at 12.5 kn
-            ('GWANGYANG', 'ITAGUAI'): 11800,             # ~39.3 days at 12.5 kn
-            ('GWANGYANG', 'TUBARAO'): 11700,             # Similar to Itaguai
-            ('GWANGYANG', 'SALDANHA BAY'): 9200,         # Via Indian Ocean
-
-            # -----------------------------------------------------------------
-            # PORT TALBOT (Wales, UK) - Limited coverage in CSV
-            # Vessel: IRON CENTURY starts here
-            # Note: ITAGUAI and TUBARAO routes exist in CSV
-            # -----------------------------------------------------------------
-            ('PORT TALBOT', 'KAMSAR ANCHORAGE'): 2800,   # ~9.3 days at 12.5 kn
-            ('PORT TALBOT', 'PORT HEDLAND'): 11500,      # ~38.3 days at 12.5 kn
-            ('PORT TALBOT', 'DAMPIER'): 11600,           # Similar to Port Hedland
-            ('PORT TALBOT', 'VANCOUVER'): 7800,          # Via Atlantic/Panama
-
-            # -----------------------------------------------------------------
-            # JUBAIL (Saudi Arabia) - Limited coverage in CSV
-            # Vessel: TITAN LEGACY starts here
-            # Note: TUBARAO route exists in CSV
-            # -----------------------------------------------------------------
-            ('JUBAIL', 'KAMSAR ANCHORAGE'): 6500,        # ~21.7 days at 12.5 kn
-            ('JUBAIL', 'PORT HEDLAND'): 5200,            # ~17.3 days at 12.5 kn
-            ('JUBAIL', 'ITAGUAI'): 9800,                 # ~32.7 days at 12.5 kn
-            ('JUBAIL', 'TABONEO'): 4500,                 # ~15 days at 12.5 kn
-            ('JUBAIL', 'DAMPIER'): 5100,                 # Similar to Port Hedland
-
-            # -----------------------------------------------------------------
-            # India ports - Various coverage gaps
-            # Vessels: ATLANTIC FORTUNE (Paradip), POLARIS SPIRIT (Kandla),
-            #          NAVIS PRIDE (Mundra), ZENITH GLORY (Vizag)
-            # -----------------------------------------------------------------
-            ('PARADIP', 'PORT HEDLAND'): 4100,           # ~13.7 days at 12.5 kn
-            ('PARADIP', 'KAMSAR ANCHORAGE'): 7600,       # ~25.3 days at 12.5 kn
-            ('PARADIP', 'ITAGUAI'): 10200,               # ~34 days at 12.5 kn
-
-            ('MUNDRA', 'KAMSAR ANCHORAGE'): 6200,        # ~20.7 days at 12.5 kn
-            ('MUNDRA', 'PORT HEDLAND'): 4800,            # ~16 days at 12.5 kn
-            ('MUNDRA', 'ITAGUAI'): 9500,                 # ~31.7 days at 12.5 kn
-
-            ('KANDLA', 'PORT HEDLAND'): 4900,            # ~16.3 days at 12.5 kn
-            ('KANDLA', 'KAMSAR ANCHORAGE'): 6100,        # ~20.3 days at 12.5 kn
-            ('KANDLA', 'ITAGUAI'): 9400,                 # ~31.3 days at 12.5 kn
-
-            # VIZAG routes - some exist in CSV, keeping only missing ones
-            ('VIZAG', 'PORT HEDLAND'): 4200,             # ~14 days at 12.5 kn
-            ('VIZAG', 'ITAGUAI'): 10500,                 # ~35 days at 12.5 kn
-
-            # -----------------------------------------------------------------
-            # XIAMEN (China) - Limited coverage in CSV
-            # Vessel: EVEREST OCEAN starts here
-            # -----------------------------------------------------------------
-            ('XIAMEN', 'KAMSAR ANCHORAGE'): 12200,       # ~40.7 days at 12.5 kn
-
-            # -----------------------------------------------------------------
-            # Cargo route estimates (load port -> discharge port)
-            # -----------------------------------------------------------------
-            ('KAMSAR ANCHORAGE', 'MANGALORE'): 7200,     # Guinea Alumina cargo
-            ('TUBARAO', 'TELUK RUBIAH'): 10800,          # Vale Malaysia cargo
-
-            # -----------------------------------------------------------------
-            # Additional market cargo routes (added based on warnings)
-            # -----------------------------------------------------------------
-            # TABONEO (Indonesia) routes for Adaro Coal cargo
-            ('QINGDAO', 'TABONEO'): 2400,                # ~8 days at 12.5 kn
-            ('GWANGYANG', 'TABONEO'): 2200,              # ~7.3 days at 12.5 kn
-
-            # PONTA DA MADEIRA (Brazil) routes for Vale cargo
-            ('MAP TA PHUT', 'PONTA DA MADEIRA'): 12600,  # ~42 days at 12.5 kn
-            ('GWANGYANG', 'PONTA DA MADEIRA'): 11900,    # ~39.7 days at 12.5 kn
-
-            # VANCOUVER (Canada) routes for Teck coal cargo
-            ('MAP TA PHUT', 'VANCOUVER'): 7200,          # ~24 days at 12.5 kn
-
-            # DAMPIER (Australia) routes for Rio Tinto cargo
-            ('GWANGYANG', 'DAMPIER'): 3500,              # ~11.7 days at 12.5 kn
-
-            # ROTTERDAM (Netherlands) market vessel position routes
-            ('ROTTERDAM', 'KAMSAR ANCHORAGE'): 3200,     # ~10.7 days at 12.5 kn
-            ('ROTTERDAM', 'PORT HEDLAND'): 11500,        # ~38.3 days at 12.5 kn
-
-            # -----------------------------------------------------------------
-            # Singapore hub - reference point
-            # -----------------------------------------------------------------
-            ('SINGAPORE', 'PORT HEDLAND'): 1678,         # Well-known route
-
-            # =================================================================
-            # BUNKER PORT DISTANCES - Added to reduce fallback rate
-            # =================================================================
-            # Distances from all 9 major bunker ports to common load/discharge
-            # ports. These are great circle estimates optimized for the bunker
-            # optimization algorithm to find optimal bunkering locations.
-            # =================================================================
-
-            # -----------------------------------------------------------------
-            # SINGAPORE (SE Asia Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('SINGAPORE', 'KAMSAR ANCHORAGE'): 8500,     # Singapore to Guinea
-            ('SINGAPORE', 'ITAGUAI'): 11200,             # Singapore to Brazil
-            ('SINGAPORE', 'TUBARAO'): 11300,             # Singapore to Brazil
-            ('SINGAPORE', 'DAMPIER'): 1750,              # Singapore to Australia
-            ('SINGAPORE', 'TABONEO'): 680,               # Singapore to Indonesia
-            ('SINGAPORE', 'PONTA DA MADEIRA'): 11400,    # Singapore to Brazil
-            ('SINGAPORE', 'KRISHNAPATNAM'): 1850,        # Singapore to India
-            ('SINGAPORE', 'TELUK RUBIAH'): 220,          # Singapore to Malaysia
-            ('SINGAPORE', 'MANGALORE'): 2100,            # Singapore to India
-            ('SINGAPORE', 'GWANGYANG'): 2460,            # Singapore to S.Korea
-            ('SINGAPORE', 'QINGDAO'): 2460,              # Singapore to China
-            ('SINGAPORE', 'SHANGHAI'): 2200,             # Singapore to China
-            ('SINGAPORE', 'FANGCHENG'): 1300,            # Singapore to China
-            ('SINGAPORE', 'CAOFEIDIAN'): 2650,           # Singapore to China
-            ('SINGAPORE', 'TIANJIN'): 2700,              # Singapore to China
-            ('SINGAPORE', 'LIANYUNGANG'): 2550,          # Singapore to China
-            ('SINGAPORE', 'PARADIP'): 1950,              # Singapore to India
-            ('SINGAPORE', 'MUNDRA'): 2400,               # Singapore to India
-            ('SINGAPORE', 'KANDLA'): 2500,               # Singapore to India
-            ('SINGAPORE', 'VIZAG'): 1900,                # Singapore to India
-            ('SINGAPORE', 'SALDANHA BAY'): 5600,         # Singapore to S.Africa
-            ('SINGAPORE', 'ROTTERDAM'): 9200,            # Singapore to Netherlands
-            ('SINGAPORE', 'VANCOUVER'): 6800,            # Singapore to Canada
-            ('SINGAPORE', 'MAP TA PHUT'): 763,           # Singapore to Thailand
-            ('SINGAPORE', 'XIAMEN'): 1650,               # Singapore to China
-            ('SINGAPORE', 'JINGTANG'): 2750,             # Singapore to China
-            ('SINGAPORE', 'JUBAIL'): 3900,               # Singapore to Saudi Arabia
-            ('SINGAPORE', 'PORT TALBOT'): 10500,         # Singapore to Wales
-
-            # -----------------------------------------------------------------
-            # FUJAIRAH (Middle East Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('FUJAIRAH', 'KAMSAR ANCHORAGE'): 6200,      # Fujairah to Guinea
-            ('FUJAIRAH', 'PORT HEDLAND'): 5300,          # Fujairah to Australia
-            ('FUJAIRAH', 'ITAGUAI'): 9800,               # Fujairah to Brazil
-            ('FUJAIRAH', 'TUBARAO'): 9900,               # Fujairah to Brazil
-            ('FUJAIRAH', 'DAMPIER'): 5400,               # Fujairah to Australia
-            ('FUJAIRAH', 'TABONEO'): 4600,               # Fujairah to Indonesia
-            ('FUJAIRAH', 'PONTA DA MADEIRA'): 10000,     # Fujairah to Brazil
-            ('FUJAIRAH', 'KRISHNAPATNAM'): 2900,         # Fujairah to India
-            ('FUJAIRAH', 'TELUK RUBIAH'): 3950,          # Fujairah to Malaysia
-            ('FUJAIRAH', 'MANGALORE'): 1900,             # Fujairah to India
-            ('FUJAIRAH', 'GWANGYANG'): 6800,             # Fujairah to S.Korea
-            ('FUJAIRAH', 'QINGDAO'): 6800,               # Fujairah to China
-            ('FUJAIRAH', 'SHANGHAI'): 6500,              # Fujairah to China
-            ('FUJAIRAH', 'FANGCHENG'): 5600,             # Fujairah to China
-            ('FUJAIRAH', 'CAOFEIDIAN'): 6950,            # Fujairah to China
-            ('FUJAIRAH', 'TIANJIN'): 7000,               # Fujairah to China
-            ('FUJAIRAH', 'LIANYUNGANG'): 6850,           # Fujairah to China
-            ('FUJAIRAH', 'PARADIP'): 2400,               # Fujairah to India
-            ('FUJAIRAH', 'MUNDRA'): 1100,                # Fujairah to India
-            ('FUJAIRAH', 'KANDLA'): 1000,                # Fujairah to India
-            ('FUJAIRAH', 'VIZAG'): 2650,                 # Fujairah to India
-            ('FUJAIRAH', 'SALDANHA BAY'): 5000,          # Fujairah to S.Africa
-            ('FUJAIRAH', 'ROTTERDAM'): 6800,             # Fujairah to Netherlands
-            ('FUJAIRAH', 'VANCOUVER'): 10500,            # Fujairah to Canada
-            ('FUJAIRAH', 'MAP TA PHUT'): 3400,           # Fujairah to Thailand
-            ('FUJAIRAH', 'XIAMEN'): 5900,                # Fujairah to China
-            ('FUJAIRAH', 'JINGTANG'): 7050,              # Fujairah to China
-            ('FUJAIRAH', 'JUBAIL'): 1050,                # Fujairah to Saudi Arabia
-            ('FUJAIRAH', 'PORT TALBOT'): 7800,           # Fujairah to Wales
-
-            # -----------------------------------------------------------------
-            # ROTTERDAM (NW Europe Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('ROTTERDAM', 'PORT HEDLAND'): 11500,        # Rotterdam to Australia
-            ('ROTTERDAM', 'ITAGUAI'): 6200,              # Rotterdam to Brazil
-            ('ROTTERDAM', 'TUBARAO'): 6300,              # Rotterdam to Brazil
-            ('ROTTERDAM', 'DAMPIER'): 11600,             # Rotterdam to Australia
-            ('ROTTERDAM', 'TABONEO'): 10100,             # Rotterdam to Indonesia
-            ('ROTTERDAM', 'PONTA DA MADEIRA'): 6400,     # Rotterdam to Brazil
-            ('ROTTERDAM', 'KRISHNAPATNAM'): 8900,        # Rotterdam to India
-            ('ROTTERDAM', 'TELUK RUBIAH'): 9600,         # Rotterdam to Malaysia
-            ('ROTTERDAM', 'MANGALORE'): 8200,            # Rotterdam to India
-            ('ROTTERDAM', 'GWANGYANG'): 12500,           # Rotterdam to S.Korea
-            ('ROTTERDAM', 'QINGDAO'): 12500,             # Rotterdam to China
-            ('ROTTERDAM', 'SHANGHAI'): 12200,            # Rotterdam to China
-            ('ROTTERDAM', 'FANGCHENG'): 11300,           # Rotterdam to China
-            ('ROTTERDAM', 'CAOFEIDIAN'): 12650,          # Rotterdam to China
-            ('ROTTERDAM', 'TIANJIN'): 12700,             # Rotterdam to China
-            ('ROTTERDAM', 'LIANYUNGANG'): 12550,         # Rotterdam to China
-            ('ROTTERDAM', 'PARADIP'): 8600,              # Rotterdam to India
-            ('ROTTERDAM', 'MUNDRA'): 7900,               # Rotterdam to India
-            ('ROTTERDAM', 'KANDLA'): 7800,               # Rotterdam to India
-            ('ROTTERDAM', 'VIZAG'): 8850,                # Rotterdam to India
-            ('ROTTERDAM', 'SALDANHA BAY'): 7000,         # Rotterdam to S.Africa
-            ('ROTTERDAM', 'VANCOUVER'): 7800,            # Rotterdam to Canada
-            ('ROTTERDAM', 'MAP TA PHUT'): 9900,          # Rotterdam to Thailand
-            ('ROTTERDAM', 'XIAMEN'): 11600,              # Rotterdam to China
-            ('ROTTERDAM', 'JINGTANG'): 12750,            # Rotterdam to China
-            ('ROTTERDAM', 'JUBAIL'): 6800,               # Rotterdam to Saudi Arabia
-            ('ROTTERDAM', 'PORT TALBOT'): 650,           # Rotterdam to Wales
-            ('ROTTERDAM', 'SINGAPORE'): 9200,            # Rotterdam to Singapore
-
-            # -----------------------------------------------------------------
-            # GIBRALTAR (Med/Atlantic Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('GIBRALTAR', 'KAMSAR ANCHORAGE'): 2500,     # Gibraltar to Guinea
-            ('GIBRALTAR', 'PORT HEDLAND'): 11200,        # Gibraltar to Australia
-            ('GIBRALTAR', 'ITAGUAI'): 5400,              # Gibraltar to Brazil
-            ('GIBRALTAR', 'TUBARAO'): 5500,              # Gibraltar to Brazil
-            ('GIBRALTAR', 'DAMPIER'): 11300,             # Gibraltar to Australia
-            ('GIBRALTAR', 'TABONEO'): 9600,              # Gibraltar to Indonesia
-            ('GIBRALTAR', 'PONTA DA MADEIRA'): 5600,     # Gibraltar to Brazil
-            ('GIBRALTAR', 'KRISHNAPATNAM'): 8200,        # Gibraltar to India
-            ('GIBRALTAR', 'TELUK RUBIAH'): 8900,         # Gibraltar to Malaysia
-            ('GIBRALTAR', 'MANGALORE'): 7500,            # Gibraltar to India
-            ('GIBRALTAR', 'GWANGYANG'): 12200,           # Gibraltar to S.Korea
-            ('GIBRALTAR', 'QINGDAO'): 12200,             # Gibraltar to China
-            ('GIBRALTAR', 'SHANGHAI'): 11900,            # Gibraltar to China
-            ('GIBRALTAR', 'FANGCHENG'): 11000,           # Gibraltar to China
-            ('GIBRALTAR', 'CAOFEIDIAN'): 12350,          # Gibraltar to China
-            ('GIBRALTAR', 'TIANJIN'): 12400,             # Gibraltar to China
-            ('GIBRALTAR', 'LIANYUNGANG'): 12250,         # Gibraltar to China
-            ('GIBRALTAR', 'PARADIP'): 7900,              # Gibraltar to India
-            ('GIBRALTAR', 'MUNDRA'): 7200,               # Gibraltar to India
-            ('GIBRALTAR', 'KANDLA'): 7100,               # Gibraltar to India
-            ('GIBRALTAR', 'VIZAG'): 8150,                # Gibraltar to India
-            ('GIBRALTAR', 'SALDANHA BAY'): 5800,         # Gibraltar to S.Africa
-            ('GIBRALTAR', 'ROTTERDAM'): 1750,            # Gibraltar to Netherlands
-            ('GIBRALTAR', 'VANCOUVER'): 8900,            # Gibraltar to Canada
-            ('GIBRALTAR', 'MAP TA PHUT'): 9200,          # Gibraltar to Thailand
-            ('GIBRALTAR', 'XIAMEN'): 11300,              # Gibraltar to China
-            ('GIBRALTAR', 'JINGTANG'): 12450,            # Gibraltar to China
-            ('GIBRALTAR', 'JUBAIL'): 6100,               # Gibraltar to Saudi Arabia
-            ('GIBRALTAR', 'PORT TALBOT'): 1450,          # Gibraltar to Wales
-            ('GIBRALTAR', 'SINGAPORE'): 8800,            # Gibraltar to Singapore
-
-            # -----------------------------------------------------------------
-            # DURBAN (Southern Africa Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('DURBAN', 'KAMSAR ANCHORAGE'): 5400,        # Durban to Guinea
-            ('DURBAN', 'PORT HEDLAND'): 5100,            # Durban to Australia
-            ('DURBAN', 'ITAGUAI'): 5800,                 # Durban to Brazil
-            ('DURBAN', 'TUBARAO'): 5900,                 # Durban to Brazil
-            ('DURBAN', 'DAMPIER'): 5200,                 # Durban to Australia
-            ('DURBAN', 'TABONEO'): 5850,                 # Durban to Indonesia
-            ('DURBAN', 'PONTA DA MADEIRA'): 6000,        # Durban to Brazil
-            ('DURBAN', 'KRISHNAPATNAM'): 3700,           # Durban to India
-            ('DURBAN', 'TELUK RUBIAH'): 4900,            # Durban to Malaysia
-            ('DURBAN', 'MANGALORE'): 3400,               # Durban to India
-            ('DURBAN', 'GWANGYANG'): 7400,               # Durban to S.Korea
-            ('DURBAN', 'QINGDAO'): 7400,                 # Durban to China
-            ('DURBAN', 'SHANGHAI'): 7100,                # Durban to China
-            ('DURBAN', 'FANGCHENG'): 6200,               # Durban to China
-            ('DURBAN', 'CAOFEIDIAN'): 7550,              # Durban to China
-            ('DURBAN', 'TIANJIN'): 7600,                 # Durban to China
-            ('DURBAN', 'LIANYUNGANG'): 7450,             # Durban to China
-            ('DURBAN', 'PARADIP'): 3500,                 # Durban to India
-            ('DURBAN', 'MUNDRA'): 3200,                  # Durban to India
-            ('DURBAN', 'KANDLA'): 3100,                  # Durban to India
-            ('DURBAN', 'VIZAG'): 3750,                   # Durban to India
-            ('DURBAN', 'SALDANHA BAY'): 850,             # Durban to S.Africa
-            ('DURBAN', 'ROTTERDAM'): 7000,               # Durban to Netherlands
-            ('DURBAN', 'VANCOUVER'): 12200,              # Durban to Canada
-            ('DURBAN', 'MAP TA PHUT'): 4700,             # Durban to Thailand
-            ('DURBAN', 'XIAMEN'): 6500,                  # Durban to China
-            ('DURBAN', 'JINGTANG'): 7650,                # Durban to China
-            ('DURBAN', 'JUBAIL'): 4000,                  # Durban to Saudi Arabia
-            ('DURBAN', 'PORT TALBOT'): 7700,             # Durban to Wales
-            ('DURBAN', 'SINGAPORE'): 4900,               # Durban to Singapore
-
-            # -----------------------------------------------------------------
-            # QINGDAO (China Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('QINGDAO', 'KAMSAR ANCHORAGE'): 11800,      # Qingdao to Guinea
-            ('QINGDAO', 'PORT HEDLAND'): 3300,           # Qingdao to Australia
-            ('QINGDAO', 'ITAGUAI'): 12200,               # Qingdao to Brazil
-            ('QINGDAO', 'TUBARAO'): 12100,               # Qingdao to Brazil
-            ('QINGDAO', 'DAMPIER'): 3400,                # Qingdao to Australia
-            ('QINGDAO', 'PONTA DA MADEIRA'): 12300,      # Qingdao to Brazil
-            ('QINGDAO', 'KRISHNAPATNAM'): 3050,          # Qingdao to India
-            ('QINGDAO', 'TELUK RUBIAH'): 2350,           # Qingdao to Malaysia
-            ('QINGDAO', 'MANGALORE'): 3450,              # Qingdao to India
-            ('QINGDAO', 'GWANGYANG'): 520,               # Qingdao to S.Korea
-            ('QINGDAO', 'SHANGHAI'): 380,                # Qingdao to China
-            ('QINGDAO', 'FANGCHENG'): 1420,              # Qingdao to China
-            ('QINGDAO', 'CAOFEIDIAN'): 280,              # Qingdao to China
-            ('QINGDAO', 'TIANJIN'): 330,                 # Qingdao to China
-            ('QINGDAO', 'LIANYUNGANG'): 180,             # Qingdao to China
-            ('QINGDAO', 'PARADIP'): 3150,                # Qingdao to India
-            ('QINGDAO', 'MUNDRA'): 3700,                 # Qingdao to India
-            ('QINGDAO', 'KANDLA'): 3800,                 # Qingdao to India
-            ('QINGDAO', 'VIZAG'): 3000,                  # Qingdao to India
-            ('QINGDAO', 'SALDANHA BAY'): 8800,           # Qingdao to S.Africa
-            ('QINGDAO', 'ROTTERDAM'): 12500,             # Qingdao to Netherlands
-            ('QINGDAO', 'VANCOUVER'): 5200,              # Qingdao to Canada
-            ('QINGDAO', 'MAP TA PHUT'): 2000,            # Qingdao to Thailand
-            ('QINGDAO', 'XIAMEN'): 850,                  # Qingdao to China
-            ('QINGDAO', 'JINGTANG'): 240,                # Qingdao to China
-            ('QINGDAO', 'JUBAIL'): 6800,                 # Qingdao to Saudi Arabia
-            ('QINGDAO', 'PORT TALBOT'): 13200,           # Qingdao to Wales
-            ('QINGDAO', 'SINGAPORE'): 2460,              # Qingdao to Singapore
-            ('QINGDAO', 'FUJAIRAH'): 6800,               # Qingdao to Fujairah
-
-            # -----------------------------------------------------------------
-            # SHANGHAI (China Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('SHANGHAI', 'KAMSAR ANCHORAGE'): 12200,     # Shanghai to Guinea
-            ('SHANGHAI', 'PORT HEDLAND'): 3238,          # Shanghai to Australia
-            ('SHANGHAI', 'ITAGUAI'): 12100,              # Shanghai to Brazil
-            ('SHANGHAI', 'TUBARAO'): 12000,              # Shanghai to Brazil
-            ('SHANGHAI', 'DAMPIER'): 3350,               # Shanghai to Australia
-            ('SHANGHAI', 'TABONEO'): 1900,               # Shanghai to Indonesia
-            ('SHANGHAI', 'PONTA DA MADEIRA'): 12200,     # Shanghai to Brazil
-            ('SHANGHAI', 'KRISHNAPATNAM'): 2950,         # Shanghai to India
-            ('SHANGHAI', 'TELUK RUBIAH'): 2100,          # Shanghai to Malaysia
-            ('SHANGHAI', 'MANGALORE'): 3350,             # Shanghai to India
-            ('SHANGHAI', 'GWANGYANG'): 490,              # Shanghai to S.Korea
-            ('SHANGHAI', 'QINGDAO'): 380,                # Shanghai to China
-            ('SHANGHAI', 'FANGCHENG'): 1100,             # Shanghai to China
-            ('SHANGHAI', 'CAOFEIDIAN'): 520,             # Shanghai to China
-            ('SHANGHAI', 'TIANJIN'): 570,                # Shanghai to China
-            ('SHANGHAI', 'LIANYUNGANG'): 240,            # Shanghai to China
-            ('SHANGHAI', 'PARADIP'): 3050,               # Shanghai to India
-            ('SHANGHAI', 'MUNDRA'): 3600,                # Shanghai to India
-            ('SHANGHAI', 'KANDLA'): 3700,                # Shanghai to India
-            ('SHANGHAI', 'VIZAG'): 2900,                 # Shanghai to India
-            ('SHANGHAI', 'SALDANHA BAY'): 9200,          # Shanghai to S.Africa
-            ('SHANGHAI', 'ROTTERDAM'): 12200,            # Shanghai to Netherlands
-            ('SHANGHAI', 'VANCOUVER'): 5400,             # Shanghai to Canada
-            ('SHANGHAI', 'MAP TA PHUT'): 1750,           # Shanghai to Thailand
-            ('SHANGHAI', 'XIAMEN'): 420,                 # Shanghai to China
-            ('SHANGHAI', 'JINGTANG'): 480,               # Shanghai to China
-            ('SHANGHAI', 'JUBAIL'): 6500,                # Shanghai to Saudi Arabia
-            ('SHANGHAI', 'PORT TALBOT'): 12900,          # Shanghai to Wales
-            ('SHANGHAI', 'SINGAPORE'): 2200,             # Shanghai to Singapore
-            ('SHANGHAI', 'FUJAIRAH'): 6500,              # Shanghai to Fujairah
-
-            # -----------------------------------------------------------------
-            # PORT LOUIS (Indian Ocean Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('PORT LOUIS', 'KAMSAR ANCHORAGE'): 5600,    # Port Louis to Guinea
-            ('PORT LOUIS', 'PORT HEDLAND'): 3600,        # Port Louis to Australia
-            ('PORT LOUIS', 'ITAGUAI'): 6600,             # Port Louis to Brazil
-            ('PORT LOUIS', 'TUBARAO'): 6700,             # Port Louis to Brazil
-            ('PORT LOUIS', 'DAMPIER'): 3700,             # Port Louis to Australia
-            ('PORT LOUIS', 'TABONEO'): 3900,             # Port Louis to Indonesia
-            ('PORT LOUIS', 'PONTA DA MADEIRA'): 6800,    # Port Louis to Brazil
-            ('PORT LOUIS', 'KRISHNAPATNAM'): 2400,       # Port Louis to India
-            ('PORT LOUIS', 'TELUK RUBIAH'): 3300,        # Port Louis to Malaysia
-            ('PORT LOUIS', 'MANGALORE'): 2100,           # Port Louis to India
-            ('PORT LOUIS', 'GWANGYANG'): 5900,           # Port Louis to S.Korea
-            ('PORT LOUIS', 'QINGDAO'): 5900,             # Port Louis to China
-            ('PORT LOUIS', 'SHANGHAI'): 5600,            # Port Louis to China
-            ('PORT LOUIS', 'FANGCHENG'): 4700,           # Port Louis to China
-            ('PORT LOUIS', 'CAOFEIDIAN'): 6050,          # Port Louis to China
-            ('PORT LOUIS', 'TIANJIN'): 6100,             # Port Louis to China
-            ('PORT LOUIS', 'LIANYUNGANG'): 5950,         # Port Louis to China
-            ('PORT LOUIS', 'PARADIP'): 2200,             # Port Louis to India
-            ('PORT LOUIS', 'MUNDRA'): 1900,              # Port Louis to India
-            ('PORT LOUIS', 'KANDLA'): 1800,              # Port Louis to India
-            ('PORT LOUIS', 'VIZAG'): 2450,               # Port Louis to India
-            ('PORT LOUIS', 'SALDANHA BAY'): 1950,        # Port Louis to S.Africa
-            ('PORT LOUIS', 'ROTTERDAM'): 7800,           # Port Louis to Netherlands
-            ('PORT LOUIS', 'VANCOUVER'): 10800,          # Port Louis to Canada
-            ('PORT LOUIS', 'MAP TA PHUT'): 3200,         # Port Louis to Thailand
-            ('PORT LOUIS', 'XIAMEN'): 5000,              # Port Louis to China
-            ('PORT LOUIS', 'JINGTANG'): 6150,            # Port Louis to China
-            ('PORT LOUIS', 'JUBAIL'): 2700,              # Port Louis to Saudi Arabia
-            ('PORT LOUIS', 'PORT TALBOT'): 8500,         # Port Louis to Wales
-            ('PORT LOUIS', 'SINGAPORE'): 3300,           # Port Louis to Singapore
-            ('PORT LOUIS', 'FUJAIRAH'): 2500,            # Port Louis to Fujairah
-
-            # -----------------------------------------------------------------
-            # RICHARDS BAY (South African Hub) - to major load ports
-            # -----------------------------------------------------------------
-            ('RICHARDS BAY', 'KAMSAR ANCHORAGE'): 5600,  # Richards Bay to Guinea
-            ('RICHARDS BAY', 'PORT HEDLAND'): 5300,      # Richards Bay to Australia
-            ('RICHARDS BAY', 'ITAGUAI'): 6000,           # Richards Bay to Brazil
-            ('RICHARDS BAY', 'TUBARAO'): 6100,           # Richards Bay to Brazil
-            ('RICHARDS BAY', 'DAMPIER'): 5400,           # Richards Bay to Australia
-            ('RICHARDS BAY', 'TABONEO'): 6050,           # Richards Bay to Indonesia
-            ('RICHARDS BAY', 'PONTA DA MADEIRA'): 6200,  # Richards Bay to Brazil
-            ('RICHARDS BAY', 'KRISHNAPATNAM'): 3900,     # Richards Bay to India
-            ('RICHARDS BAY', 'TELUK RUBIAH'): 5100,      # Richards Bay to Malaysia
-            ('RICHARDS BAY', 'MANGALORE'): 3600,         # Richards Bay to India
-            ('RICHARDS BAY', 'GWANGYANG'): 7600,         # Richards Bay to S.Korea
-            ('RICHARDS BAY', 'QINGDAO'): 7600,           # Richards Bay to China
-            ('RICHARDS BAY', 'SHANGHAI'): 7300,          # Richards Bay to China
-            ('RICHARDS BAY', 'FANGCHENG'): 6400,         # Richards Bay to China
-            ('RICHARDS BAY', 'CAOFEIDIAN'): 7750,        # Richards Bay to China
-            ('RICHARDS BAY', 'TIANJIN'): 7800,           # Richards Bay to China
-            ('RICHARDS BAY', 'LIANYUNGANG'): 7650,       # Richards Bay to China
-            ('RICHARDS BAY', 'PARADIP'): 3700,           # Richards Bay to India
-            ('RICHARDS BAY', 'MUNDRA'): 3400,            # Richards Bay to India
-            ('RICHARDS BAY', 'KANDLA'): 3300,            # Richards Bay to India
-            ('RICHARDS BAY', 'VIZAG'): 3950,             # Richards Bay to India
-            ('RICHARDS BAY', 'SALDANHA BAY'): 900,       # Richards Bay to S.Africa
-            ('RICHARDS BAY', 'ROTTERDAM'): 7200,         # Richards Bay to Netherlands
-            ('RICHARDS BAY', 'VANCOUVER'): 12400,        # Richards Bay to Canada
-            ('RICHARDS BAY', 'MAP TA PHUT'): 4900,       # Richards Bay to Thailand
-            ('RICHARDS BAY', 'XIAMEN'): 6700,            # Richards Bay to China
-            ('RICHARDS BAY', 'JINGTANG'): 7850,          # Richards Bay to China
-            ('RICHARDS BAY', 'JUBAIL'): 4200,            # Richards Bay to Saudi Arabia
-            ('RICHARDS BAY', 'PORT TALBOT'): 7900,       # Richards Bay to Wales
-            ('RICHARDS BAY', 'SINGAPORE'): 5100,         # Richards Bay to Singapore
-            ('RICHARDS BAY', 'FUJAIRAH'): 4100,          # Richards Bay to Fujairah
-
-            # =================================================================
-            # VESSEL CURRENT POSITIONS TO BUNKER PORTS
-            # =================================================================
-            # Common vessel positions to bunker ports for the first leg of
-            # bunker routing (vessel_current_port -> bunker_port)
-            # =================================================================
-
-            # MAP TA PHUT (common vessel position) to bunker ports
-            ('MAP TA PHUT', 'SINGAPORE'): 763,           # Thailand to Singapore
-            ('MAP TA PHUT', 'FUJAIRAH'): 3400,           # Thailand to Fujairah
-            ('MAP TA PHUT', 'ROTTERDAM'): 9900,          # Thailand to Rotterdam
-            ('MAP TA PHUT', 'GIBRALTAR'): 9200,          # Thailand to Gibraltar
-            ('MAP TA PHUT', 'DURBAN'): 4700,             # Thailand to Durban
-            ('MAP TA PHUT', 'QINGDAO'): 2000,            # Thailand to Qingdao
-            ('MAP TA PHUT', 'SHANGHAI'): 1750,           # Thailand to Shanghai
-            ('MAP TA PHUT', 'PORT LOUIS'): 3200,         # Thailand to Port Louis
-            ('MAP TA PHUT', 'RICHARDS BAY'): 4900,       # Thailand to Richards Bay
-
-            # GWANGYANG (common vessel position) to bunker ports
-            ('GWANGYANG', 'SINGAPORE'): 2460,            # S.Korea to Singapore
-            ('GWANGYANG', 'FUJAIRAH'): 6800,             # S.Korea to Fujairah
-            ('GWANGYANG', 'ROTTERDAM'): 12500,           # S.Korea to Rotterdam
-            ('GWANGYANG', 'GIBRALTAR'): 12200,           # S.Korea to Gibraltar
-            ('GWANGYANG', 'DURBAN'): 7400,               # S.Korea to Durban
-            ('GWANGYANG', 'QINGDAO'): 520,               # S.Korea to Qingdao
-            ('GWANGYANG', 'SHANGHAI'): 490,              # S.Korea to Shanghai
-            ('GWANGYANG', 'PORT LOUIS'): 5900,           # S.Korea to Port Louis
-            ('GWANGYANG', 'RICHARDS BAY'): 7600,         # S.Korea to Richards Bay
-
-            # PORT TALBOT (common vessel position) to bunker ports
-            ('PORT TALBOT', 'SINGAPORE'): 10500,         # Wales to Singapore
-            ('PORT TALBOT', 'FUJAIRAH'): 7800,           # Wales to Fujairah
-            ('PORT TALBOT', 'ROTTERDAM'): 650,           # Wales to Rotterdam
-            ('PORT TALBOT', 'GIBRALTAR'): 1450,          # Wales to Gibraltar
-            ('PORT TALBOT', 'DURBAN'): 7700,             # Wales to Durban
-            ('PORT TALBOT', 'QINGDAO'): 13200,           # Wales to Qingdao
-            ('PORT TALBOT', 'SHANGHAI'): 12900,          # Wales to Shanghai
-            ('PORT TALBOT', 'PORT LOUIS'): 8500,         # Wales to Port Louis
-            ('PORT TALBOT', 'RICHARDS BAY'): 7900,       # Wales to Richards Bay
-
-            # JUBAIL (common vessel position) to bunker ports
-            ('JUBAIL', 'SINGAPORE'): 3900,               # Saudi Arabia to Singapore
-            ('JUBAIL', 'FUJAIRAH'): 1050,                # Saudi Arabia to Fujairah
-            ('JUBAIL', 'ROTTERDAM'): 6800,               # Saudi Arabia to Rotterdam
-            ('JUBAIL', 'GIBRALTAR'): 6100,               # Saudi Arabia to Gibraltar
-            ('JUBAIL', 'DURBAN'): 4000,                  # Saudi Arabia to Durban
-            ('JUBAIL', 'QINGDAO'): 6800,                 # Saudi Arabia to Qingdao
-            ('JUBAIL', 'SHANGHAI'): 6500,                # Saudi Arabia to Shanghai
-            ('JUBAIL', 'PORT LOUIS'): 2700,              # Saudi Arabia to Port Louis
-            ('JUBAIL', 'RICHARDS BAY'): 4200,            # Saudi Arabia to Richards Bay
-
-            # PARADIP (common vessel position) to bunker ports
-            ('PARADIP', 'SINGAPORE'): 1950,              # India to Singapore
-            ('PARADIP', 'FUJAIRAH'): 2400,               # India to Fujairah
-            ('PARADIP', 'ROTTERDAM'): 8600,              # India to Rotterdam
-            ('PARADIP', 'GIBRALTAR'): 7900,              # India to Gibraltar
-            ('PARADIP', 'DURBAN'): 3500,                 # India to Durban
-            ('PARADIP', 'QINGDAO'): 3150,                # India to Qingdao
-            ('PARADIP', 'SHANGHAI'): 3050,               # India to Shanghai
-            ('PARADIP', 'PORT LOUIS'): 2200,             # India to Port Louis
-            ('PARADIP', 'RICHARDS BAY'): 3700,           # India to Richards Bay
-
-            # QINGDAO (common vessel position) to bunker ports
-            ('QINGDAO', 'SINGAPORE'): 2460,              # China to Singapore
-            ('QINGDAO', 'ROTTERDAM'): 12500,             # China to Rotterdam
-            ('QINGDAO', 'GIBRALTAR'): 12200,             # China to Gibraltar
-            ('QINGDAO', 'DURBAN'): 7400,                 # China to Durban
-            ('QINGDAO', 'SHANGHAI'): 380,                # China to Shanghai
-            ('QINGDAO', 'PORT LOUIS'): 5900,             # China to Port Louis
-            ('QINGDAO', 'RICHARDS BAY'): 7600,           # China to Richards Bay
-
-            # XIAMEN (common vessel position) to bunker ports
-            ('XIAMEN', 'SINGAPORE'): 1650,               # China to Singapore
-            ('XIAMEN', 'FUJAIRAH'): 5900,                # China to Fujairah
-            ('XIAMEN', 'ROTTERDAM'): 11600,              # China to Rotterdam
-            ('XIAMEN', 'GIBRALTAR'): 11300,              # China to Gibraltar
-            ('XIAMEN', 'DURBAN'): 6500,                  # China to Durban
-            ('XIAMEN', 'QINGDAO'): 850,                  # China to Qingdao
-            ('XIAMEN', 'SHANGHAI'): 420,                 # China to Shanghai
-            ('XIAMEN', 'PORT LOUIS'): 5000,              # China to Port Louis
-            ('XIAMEN', 'RICHARDS BAY'): 6700,            # China to Richards Bay
-
-            # FANGCHENG (common vessel position) to bunker ports
-            ('FANGCHENG', 'SINGAPORE'): 1300,            # China to Singapore
-            ('FANGCHENG', 'FUJAIRAH'): 5600,             # China to Fujairah
-            ('FANGCHENG', 'ROTTERDAM'): 11300,           # China to Rotterdam
-            ('FANGCHENG', 'GIBRALTAR'): 11000,           # China to Gibraltar
-            ('FANGCHENG', 'DURBAN'): 6200,               # China to Durban
-            ('FANGCHENG', 'QINGDAO'): 1420,              # China to Qingdao
-            ('FANGCHENG', 'SHANGHAI'): 1100,             # China to Shanghai
-            ('FANGCHENG', 'PORT LOUIS'): 4700,           # China to Port Louis
-            ('FANGCHENG', 'RICHARDS BAY'): 6400,         # China to Richards Bay
-
-            # TIANJIN (common vessel position) to bunker ports
-            ('TIANJIN', 'SINGAPORE'): 2700,              # China to Singapore
-            ('TIANJIN', 'FUJAIRAH'): 7000,               # China to Fujairah
-            ('TIANJIN', 'ROTTERDAM'): 12700,             # China to Rotterdam
-            ('TIANJIN', 'GIBRALTAR'): 12400,             # China to Gibraltar
-            ('TIANJIN', 'DURBAN'): 7600,                 # China to Durban
-            ('TIANJIN', 'QINGDAO'): 330,                 # China to Qingdao
-            ('TIANJIN', 'SHANGHAI'): 570,                # China to Shanghai
-            ('TIANJIN', 'PORT LOUIS'): 6100,             # China to Port Louis
-            ('TIANJIN', 'RICHARDS BAY'): 7800,           # China to Richards Bay
-
-            # VIZAG (common vessel position) to bunker ports
-            ('VIZAG', 'SINGAPORE'): 1900,                # India to Singapore
-            ('VIZAG', 'FUJAIRAH'): 2650,                 # India to Fujairah
-            ('VIZAG', 'ROTTERDAM'): 8850,                # India to Rotterdam
-            ('VIZAG', 'GIBRALTAR'): 8150,                # India to Gibraltar
-            ('VIZAG', 'DURBAN'): 3750,                   # India to Durban
-            ('VIZAG', 'QINGDAO'): 3000,                  # India to Qingdao
-            ('VIZAG', 'SHANGHAI'): 2900,                 # India to Shanghai
-            ('VIZAG', 'PORT LOUIS'): 2450,               # India to Port Louis
-            ('VIZAG', 'RICHARDS BAY'): 3950,             # India to Richards Bay
-
-            # MUNDRA (common vessel position) to bunker ports
-            ('MUNDRA', 'SINGAPORE'): 2400,               # India to Singapore
-            ('MUNDRA', 'FUJAIRAH'): 1100,                # India to Fujairah
-            ('MUNDRA', 'ROTTERDAM'): 7900,               # India to Rotterdam
-            ('MUNDRA', 'GIBRALTAR'): 7200,               # India to Gibraltar
-            ('MUNDRA', 'DURBAN'): 3200,                  # India to Durban
-            ('MUNDRA', 'QINGDAO'): 3700,                 # India to Qingdao
-            ('MUNDRA', 'SHANGHAI'): 3600,                # India to Shanghai
-            ('MUNDRA', 'PORT LOUIS'): 1900,              # India to Port Louis
-            ('MUNDRA', 'RICHARDS BAY'): 3400,            # India to Richards Bay
-
-            # KANDLA (common vessel position) to bunker ports
-            ('KANDLA', 'SINGAPORE'): 2500,               # India to Singapore
-            ('KANDLA', 'FUJAIRAH'): 1000,                # India to Fujairah
-            ('KANDLA', 'ROTTERDAM'): 7800,               # India to Rotterdam
-            ('KANDLA', 'GIBRALTAR'): 7100,               # India to Gibraltar
-            ('KANDLA', 'DURBAN'): 3100,                  # India to Durban
-            ('KANDLA', 'QINGDAO'): 3800,                 # India to Qingdao
-            ('KANDLA', 'SHANGHAI'): 3700,                # India to Shanghai
-            ('KANDLA', 'PORT LOUIS'): 1800,              # India to Port Louis
-            ('KANDLA', 'RICHARDS BAY'): 3300,            # India to Richards Bay
-
-            # ROTTERDAM (common vessel position) to bunker ports
-            ('ROTTERDAM', 'SINGAPORE'): 9200,            # Netherlands to Singapore
-            ('ROTTERDAM', 'FUJAIRAH'): 6800,             # Netherlands to Fujairah
-            ('ROTTERDAM', 'GIBRALTAR'): 1750,            # Netherlands to Gibraltar
-            ('ROTTERDAM', 'DURBAN'): 7000,               # Netherlands to Durban
-            ('ROTTERDAM', 'QINGDAO'): 12500,             # Netherlands to Qingdao
-            ('ROTTERDAM', 'SHANGHAI'): 12200,            # Netherlands to Shanghai
-            ('ROTTERDAM', 'PORT LOUIS'): 7800,           # Netherlands to Port Louis
-            ('ROTTERDAM', 'RICHARDS BAY'): 7200,         # Netherlands to Richards Bay
-
-            # SALDANHA BAY (common vessel position) to bunker ports
-            ('SALDANHA BAY', 'SINGAPORE'): 5600,         # S.Africa to Singapore
-            ('SALDANHA BAY', 'FUJAIRAH'): 5000,          # S.Africa to Fujairah
-            ('SALDANHA BAY', 'ROTTERDAM'): 7000,         # S.Africa to Rotterdam
-            ('SALDANHA BAY', 'GIBRALTAR'): 5800,         # S.Africa to Gibraltar
-            ('SALDANHA BAY', 'DURBAN'): 850,             # S.Africa to Durban
-            ('SALDANHA BAY', 'QINGDAO'): 8800,           # S.Africa to Qingdao
-            ('SALDANHA BAY', 'SHANGHAI'): 9200,          # S.Africa to Shanghai
-            ('SALDANHA BAY', 'PORT LOUIS'): 1950,        # S.Africa to Port Louis
-            ('SALDANHA BAY', 'RICHARDS BAY'): 900,       # S.Africa to Richards Bay
+        # Keyed by DistanceSource value so the hot path is one dict increment
+        self._lookup_stats = {
+            DistanceSource.CSV: 0, DistanceSource.CSV_REVERSE: 0,
+            DistanceSource.ESTIMATE: 0, DistanceSource.NOT_FOUND: 0,
         }
+        # Track which estimates are actually used: key -> [count, distance]
+        self._estimate_usage: Dict[Tuple[str, str], list] = {}
+
+        # Shared module-level tables (built once at import), exposed read-only
+        # so the derived caches below cannot go stale
+        self.port_aliases = MappingProxyType(_PORT_ALIASES)
+        self.estimated_distances = MappingProxyType(_ESTIMATED_DISTANCES)
+
+        # Flat name -> alias group for every known standard/alias name, so exact
+        # names skip the substring scan. Built with the scan itself, so results
+        # match it (including which group wins on overlapping substrings).
+        # Other spellings are added on first use by _normalize_port.
+        self._alias_group: Dict[str, Tuple[str, ...]] = {}
+        for standard, aliases in self.port_aliases.items():
+            for name in (standard, *aliases):
+                if name not in self._alias_group:
+                    self._alias_group[name] = self._scan_aliases(name)
+
+        # Estimated-distance index is attached on the first CSV miss
+        # (see _build_estimate_index); most lookups never need it.
+        self._est_port_id: Optional[Mapping[str, int]] = None
+
+        # Dense port x port matrix for batch gathers, built on first use
+        # (see _build_dense_matrix)
+        self._port_id: Dict[str, int] = {}
+        self._dense: Optional[np.ndarray] = None
+
+        # Raw port name -> interned upper/stripped name (see _up)
+        self._upper_cache: Dict[str, str] = {}
+
+        # Per-instance memo of resolved (port_from, port_to) pairs. Tables are
+        # read-only after __init__, so entries never go stale.
+        self._resolve_cached = functools.lru_cache(maxsize=8192)(self._resolve)
+
+    def _build_estimate_index(self):
+        """Attach the shared normalized estimated-distance index (first use only)."""
+        (self._est_from, self._est_to, self._est_dist,
+         self._est_index, est_port_id) = _estimate_index()
+        # Set last: a non-None id map marks the index as ready
+        self._est_port_id = est_port_id
+
+    def _build_dense_matrix(self):
+        """
+        Build the dense distance matrix used by get_distances_batch.
 
-        # Pre-build normalized lookup for estimated distances
-        self._normalized_estimates: Dict[Tuple[str, str], float] = {}
-        for (port_from, port_to), distance in self.estimated_distances.items():
-            # Add both directions
-            self._normalized_estimates[(port_from.upper(), port_to.upper())] = distance
-            self._normalized_estimates[(port_to.upper(), port_from.upper())] = distance
-    
-    def _normalize_port(self, port: str) -> List[str]:
-        """Get possible port names for fuzzy matching."""
-        port_upper = port.upper().strip()
-        
+        Cell [i, j] holds the same value a lookup of table names i -> j would
+        return: 0 on the diagonal, CSV direct, else CSV reverse, else
+        estimate, else NaN. The extra last row/column stays NaN so unknown
+        names can map to id -1.
+        """
+        if self._est_port_id is None:
+            self._build_estimate_index()
+        names = set(self._routes)
+        for row in self._routes.values():
+            names.update(row)
+        names.update(self._est_port_id)
+        port_id = {name: i for i, name in enumerate(sorted(names))}
+
+        n = len(port_id)
+        dense = np.full((n + 1, n + 1), np.nan)
+
+        # Estimates first so CSV routes overwrite them
+        est_names = sorted(self._est_port_id, key=self._est_port_id.get)
+        est_to_global = np.array([port_id[name] for name in est_names], dtype=np.intp)
+        rows = np.fromiter(self._est_index.values(), dtype=np.intp)
+        dense[est_to_global[self._est_from[rows]], est_to_global[self._est_to[rows]]] = \
+            self._est_dist[rows]
+
+        fi, ti, dist = [], [], []
+        for f, row in self._routes.items():
+            i = port_id[f]
+            for t, hit in row.items():
+                fi.append(i)
+                ti.append(port_id[t])
+                dist.append(hit[0])
+        dense[fi, ti] = dist
+        # Same port is always 0 nm, as in get_distance_with_source
+        np.fill_diagonal(dense[:n, :n], 0.0)
+
+        self._port_id = port_id
+        self._dense = dense
+
+    def _scan_aliases(self, port_upper: str) -> Optional[Tuple[str, ...]]:
+        """Find the alias group for a name by substring matching (slow path)."""
         for standard, aliases in self.port_aliases.items():
             if any(alias in port_upper or port_upper in alias for alias in aliases):
-                return [a.upper() for a in aliases]
+                return aliases
             if standard in port_upper or port_upper in standard:
-                return [a.upper() for a in aliases]
-        
-        return [port_upper]
+                return aliases
+        return None
+
+    def _up(self, port: str) -> str:
+        """Uppercase/strip a port name once per distinct input string."""
+        port_upper = self._upper_cache.get(port)
+        if port_upper is None:
+            port_upper = sys.intern(port.upper().strip())
+            self._upper_cache[port] = port_upper
+        return port_upper
+
+    def _normalize_port(self, port: str) -> List[str]:
+        """Get possible port names for fuzzy matching."""
+        port_upper = self._up(port)
+
+        aliases = self._alias_group.get(port_upper)
+        if aliases is None:
+            # Slow path once per new spelling; remember the outcome
+            aliases = self._scan_aliases(port_upper) or (sys.intern(port_upper),)
+            self._alias_group[port_upper] = aliases
+        return list(aliases)
     
     def get_distance(self, port_from: str, port_to: str) -> Optional[float]:
         """
@@ -928,8 +1220,14 @@ class PortDistanceManager:
 
         Returns None if not found (logs error).
         """
-        distance, source, matched_from, matched_to = self.get_distance_with_source(port_from, port_to)
-        return distance
+        result = self._resolve_cached(port_from, port_to)
+        source = result[1]
+        if source == DistanceSource.CSV or source == DistanceSource.CSV_REVERSE:
+            # Common case: only a counter to bump, no audit bookkeeping
+            self._lookup_stats[source] += 1
+        else:
+            self._record_lookup(port_from, port_to, result)
+        return result[0]
 
     def get_distance_with_source(self, port_from: str, port_to: str) -> Tuple[Optional[float], str, Optional[str], Optional[str]]:
         """
@@ -939,59 +1237,140 @@ class PortDistanceManager:
             Tuple of (distance, source, matched_from_port, matched_to_port)
             source is one of: 'CSV', 'CSV_REVERSE', 'ESTIMATE', 'NOT_FOUND'
         """
+        result = self._resolve_cached(port_from, port_to)
+        self._record_lookup(port_from, port_to, result)
+        return result
+
+    def _record_lookup(self, port_from: str, port_to: str,
+                       result: Tuple[Optional[float], str, Optional[str], Optional[str]]):
+        """Update stats/estimate usage and log for one lookup (kept outside the cache)."""
+        distance, source = result[0], result[1]
+        self._lookup_stats[source] += 1
+        if source == DistanceSource.ESTIMATE:
+            # Track which estimates are being used
+            key = (port_from.upper(), port_to.upper())
+            slot = self._estimate_usage.setdefault(key, [0, distance])
+            slot[0] += 1
+
+            if self.verbose and distance_logger.isEnabledFor(logging.INFO):
+                distance_logger.info(
+                    "Using ESTIMATED distance: %s -> %s = %s nm (not in CSV)",
+                    port_from, port_to, format(distance, ',.0f'),
+                )
+        elif source == DistanceSource.NOT_FOUND:
+            distance_logger.warning("Distance NOT FOUND: %s -> %s", port_from, port_to)
+
+    def _resolve(self, port_from: str, port_to: str) -> Tuple[Optional[float], str, Optional[str], Optional[str]]:
+        """Resolve a port pair without side effects (memoized per instance as _resolve_cached)."""
+        # Identical names: skip alias expansion and the set intersection
+        port_upper = self._up(port_from)
+        if port_upper == self._up(port_to):
+            return 0.0, DistanceSource.CSV, port_upper, port_upper
+
         from_options = self._normalize_port(port_from)
         to_options = self._normalize_port(port_to)
 
         # Same-port check — distance is 0 if ports resolve to the same name
-        common = set(from_options) & set(to_options)
-        if common:
-            matched = next(iter(common))
-            self._lookup_stats['csv'] += 1
+        # (alias lists are tiny, so a membership scan beats building sets)
+        matched = next((t for t in to_options if t in from_options), None)
+        if matched is not None:
             return 0.0, DistanceSource.CSV, matched, matched
 
-        # Try all combinations in main distance table
+        # Try all combinations in main route table (direct + reverse folded)
         for f in from_options:
+            row = self._routes.get(f, _EMPTY_ROW)
             for t in to_options:
-                # Direct lookup
-                if (f, t) in self.distances:
-                    self._lookup_stats['csv'] += 1
-                    return self.distances[(f, t)], DistanceSource.CSV, f, t
-                # Reverse lookup
-                if (t, f) in self.distances:
-                    self._lookup_stats['csv_reverse'] += 1
-                    return self.distances[(t, f)], DistanceSource.CSV_REVERSE, t, f
+                hit = row.get(t)
+                if hit is not None:
+                    return hit
 
         # Check pre-normalized estimated distances (O(1) lookup per combination)
+        if self._est_port_id is None:
+            self._build_estimate_index()
+        est_port_id = self._est_port_id
         for f in from_options:
+            fi = est_port_id.get(f)
+            if fi is None:
+                continue
             for t in to_options:
-                if (f, t) in self._normalized_estimates:
-                    self._lookup_stats['estimate'] += 1
-                    # Track which estimates are being used
-                    key = (port_from.upper(), port_to.upper())
-                    self._estimate_usage[key] = self._estimate_usage.get(key, 0) + 1
-
-                    if self.verbose:
-                        distance_logger.info(
-                            f"Using ESTIMATED distance: {port_from} -> {port_to} = "
-                            f"{self._normalized_estimates[(f, t)]:,.0f} nm (not in CSV)"
-                        )
-                    return self._normalized_estimates[(f, t)], DistanceSource.ESTIMATE, f, t
-
-        # Not found
-        self._lookup_stats['not_found'] += 1
-        distance_logger.warning(f"Distance NOT FOUND: {port_from} -> {port_to}")
+                ti = est_port_id.get(t)
+                if ti is None:
+                    continue
+                idx = self._est_index.get((fi << 16) | ti)
+                if idx is not None:
+                    return float(self._est_dist[idx]), DistanceSource.ESTIMATE, f, t
+
         return None, DistanceSource.NOT_FOUND, None, None
 
+    def lookup_many(self, from_ports: Sequence[str], to_ports: Sequence[str]) -> np.ndarray:
+        """
+        Get distances for many (from, to) port pairs at once.
+
+        Each distinct pair is resolved once (same priority as get_distance),
+        then results are gathered back to input order with one fancy-index.
+        Lookup stats still count every pair. Missing distances are NaN.
+        """
+        if len(from_ports) != len(to_ports):
+            raise ValueError("from_ports and to_ports must have the same length")
+
+        pair_index: Dict[Tuple[str, str], int] = {}
+        codes = np.fromiter(
+            (pair_index.setdefault(pair, len(pair_index)) for pair in zip(from_ports, to_ports)),
+            dtype=np.intp, count=len(from_ports),
+        )
+        counts = np.bincount(codes, minlength=len(pair_index))
+
+        unique_distances = np.full(len(pair_index), np.nan)
+        for (port_from, port_to), k in pair_index.items():
+            distance, source, _, _ = self.get_distance_with_source(port_from, port_to)
+            if distance is not None:
+                unique_distances[k] = distance
+            # Account for repeats of this pair without re-resolving it
+            repeats = int(counts[k]) - 1
+            if repeats:
+                self._lookup_stats[source] += repeats
+                if source == DistanceSource.ESTIMATE:
+                    key = (port_from.upper(), port_to.upper())
+                    self._estimate_usage[key][0] += repeats
+
+        return unique_distances[codes]
+
+    def get_distances_batch(self, from_ports: Sequence[str], to_ports: Sequence[str]) -> np.ndarray:
+        """
+        Gather distances for many pairs of table port names in one NumPy call.
+
+        For bulk callers that already hold exact (CSV/estimate) port names:
+        no alias matching and no lookup stats. Unknown names or pairs give
+        NaN. Use lookup_many() for free-form port names.
+        """
+        if self._dense is None:
+            self._build_dense_matrix()
+        port_id = self._port_id
+        from_ids = np.fromiter(
+            (port_id.get(self._up(p), -1) for p in from_ports), dtype=np.intp, count=len(from_ports)
+        )
+        to_ids = np.fromiter(
+            (port_id.get(self._up(p), -1) for p in to_ports), dtype=np.intp, count=len(to_ports)
+        )
+        return self._dense[from_ids, to_ids]
+
     def get_lookup_stats(self) -> Dict:
-        """Get statistics on distance lookup sources."""
+        """
+        Get statistics on distance lookup sources.
+
+        Counts lookups that reach this manager. FreightCalculator caches its
+        bunker-candidate legs per port, so repeat voyages from/to the same
+        port add nothing here: the totals count distinct candidate legs,
+        not every leg each voyage evaluates.
+        """
         total = sum(self._lookup_stats.values())
         return {
             'total_lookups': total,
-            'csv_lookups': self._lookup_stats['csv'],
-            'csv_reverse_lookups': self._lookup_stats['csv_reverse'],
-            'estimate_lookups': self._lookup_stats['estimate'],
-            'not_found': self._lookup_stats['not_found'],
-            'estimates_used': dict(self._estimate_usage),
+            'csv_lookups': self._lookup_stats[DistanceSource.CSV],
+            'csv_reverse_lookups': self._lookup_stats[DistanceSource.CSV_REVERSE],
+            'estimate_lookups': self._lookup_stats[DistanceSource.ESTIMATE],
+            'not_found': self._lookup_stats[DistanceSource.NOT_FOUND],
+            'estimates_used': {key: slot[0] for key, slot in self._estimate_usage.items()},
         }
 
     def print_lookup_report(self):
@@ -1006,10 +1385,9 @@ class PortDistanceManager:
         print(f"  Estimates used:     {stats['estimate_lookups']}")
         print(f"  Not found:          {stats['not_found']}")
 
-        if stats['estimates_used']:
+        if self._estimate_usage:
             print("\nEstimated distances used:")
-            for (from_p, to_p), count in sorted(stats['estimates_used'].items()):
-                dist = self.get_distance(from_p, to_p)
+            for (from_p, to_p), (count, dist) in sorted(self._estimate_usage.items()):
                 print(f"  {from_p} -> {to_p}: {dist:,.0f} nm (used {count}x)")
 
         if stats['not_found'] > 0:
@@ -1027,17 +1405,10 @@ class PortDistanceManager:
             - has_csv_routes: True if any routes exist in CSV for this port
         """
         normalized = self._normalize_port(port)
-        is_aliased = normalized != [port.upper().strip()]
+        is_aliased = normalized != [self._up(port)]
 
         # Check if any routes exist in CSV
-        has_csv_routes = False
-        for norm_port in normalized:
-            for (f, t) in self.distances.keys():
-                if f == norm_port or t == norm_port:
-                    has_csv_routes = True
-                    break
-            if has_csv_routes:
-                break
+        has_csv_routes = any(n in self._ports_in_csv for n in normalized)
 
         return is_aliased or has_csv_routes, normalized, has_csv_routes
 
@@ -1093,6 +1464,57 @@ class PortDistanceManager:
 # FREIGHT CALCULATOR
 # =============================================================================
 
+_MONTH_ABBR = {
+    name: number for number, name in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _strptime_date(date_str: str) -> datetime:
+    """Parse 'DD Mon YYYY' (cached: the same ETD/laycan strings recur per voyage)."""
+    # Fast path for the canonical form; anything else (and any error) goes
+    # through strptime so accepted inputs and error messages stay the same
+    parts = date_str.split(' ')
+    if len(parts) == 3:
+        day, month, year = parts
+        month_number = _MONTH_ABBR.get(month)
+        if (month_number and len(day) <= 2 and len(year) == 4
+                and (day + year).isascii() and (day + year).isdigit()):
+            try:
+                return datetime(int(year), month_number, int(day))
+            except ValueError:
+                pass
+    return datetime.strptime(date_str, '%d %b %Y')
+
+
+@functools.lru_cache(maxsize=1024)
+def _cargo_qty_bounds(quantity: int, tolerance: float) -> Tuple[int, int]:
+    """(max, min) loadable quantity for a cargo's +/- tolerance (vessel-independent)."""
+    return int(quantity * (1 + tolerance)), int(quantity * (1 - tolerance))
+
+
+@functools.lru_cache(maxsize=32)
+def fleet_arrays(records: Tuple) -> Mapping[str, np.ndarray]:
+    """
+    Numeric fields of a tuple of Vessels (or Cargoes) as parallel float64
+    columns, one entry per record (struct-of-arrays).
+
+    Cached per tuple (the dataclasses are frozen and hashable); the arrays
+    are read-only since they are shared between callers.
+    """
+    if not records:
+        return MappingProxyType({})
+    columns = {}
+    for f in fields(records[0]):
+        if f.type in (int, float):
+            col = np.array([getattr(r, f.name) for r in records], dtype=float)
+            col.setflags(write=False)
+            columns[f.name] = col
+    return MappingProxyType(columns)
+
+
 class FreightCalculator:
     """
     Professional freight calculator for Capesize voyage analysis.
@@ -1113,11 +1535,52 @@ class FreightCalculator:
         self.distances = distance_manager
         self.bunker_prices = bunker_prices
         self.config = config or VoyageConfig()
+        # (port, fuel_type) -> price; get_price does a substring scan per call
+        self._price_cache: Dict[Tuple[str, str], float] = {}
+        # Per bunker-candidate tuple: price arrays, and leg arrays per port
+        self._candidate_price_cache: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray]] = {}
+        self._candidate_leg_cache: Dict[Tuple[Tuple[str, ...], str, bool], np.ndarray] = {}
+
+    def _price(self, port: str, fuel_type: str) -> float:
+        """Memoized bunker_prices.get_price (prices are fixed for a calculator's lifetime)."""
+        key = (port, fuel_type)
+        price = self._price_cache.get(key)
+        if price is None:
+            price = self._price_cache[key] = self.bunker_prices.get_price(port, fuel_type)
+        return price
+
+    def _candidate_prices(self, candidates: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """VLSFO and MGO price arrays aligned with a bunker candidate tuple (cached)."""
+        arrays = self._candidate_price_cache.get(candidates)
+        if arrays is None:
+            arrays = self._candidate_price_cache[candidates] = (
+                np.array([self._price(p, 'VLSFO') for p in candidates], dtype=float),
+                np.array([self._price(p, 'MGO') for p in candidates], dtype=float),
+            )
+        return arrays
+
+    def _candidate_legs(self, candidates: Tuple[str, ...], port: str, outbound: bool) -> np.ndarray:
+        """
+        Distances port -> each candidate (outbound) or candidate -> port,
+        aligned with the candidate tuple and cached per port. NaN = unavailable.
+        Only the first call per port goes through get_distance, so only that
+        one shows up in the distance manager's lookup stats.
+        """
+        key = (candidates, port, outbound)
+        legs = self._candidate_leg_cache.get(key)
+        if legs is None:
+            get_distance = self.distances.get_distance
+            if outbound:
+                values = [get_distance(port, c) for c in candidates]
+            else:
+                values = [get_distance(c, port) for c in candidates]
+            legs = self._candidate_leg_cache[key] = np.array(values, dtype=float)
+        return legs
 
     def _parse_date(self, date_str: str, field_name: str) -> datetime:
         """Parse a date string with helpful error message."""
         try:
-            return datetime.strptime(date_str, '%d %b %Y')
+            return _strptime_date(date_str)
         except ValueError as e:
             raise ValueError(
                 f"Invalid date format for {field_name}: '{date_str}'. "
@@ -1134,15 +1597,21 @@ class FreightCalculator:
         fuel_consumption_rate_vlsfo: float,  # MT/day at sea
         fuel_consumption_rate_mgo: float,
         hire_rate: float,
+        direct_distance: Optional[float] = None,
     ) -> Tuple[Optional[str], float, float, float, float]:
         """
         Find optimal bunkering port for the voyage.
 
+        Args:
+            direct_distance: Current port -> load port distance if the caller
+                has already looked it up (looked up here otherwise)
+
         Returns:
             (selected_port, leg1_distance, leg2_distance, savings, bunker_cost)
         """
         # Get direct distance baseline
-        direct_distance = self.distances.get_distance(vessel.current_port, cargo.load_port)
+        if direct_distance is None:
+            direct_distance = self.distances.get_distance(vessel.current_port, cargo.load_port)
         if not direct_distance:
             # Fallback: assume bunkering at load port
             return None, 0, direct_distance or 0, 0, 0
@@ -1151,62 +1620,58 @@ class FreightCalculator:
         candidates = get_bunker_candidates(vessel.current_port, cargo.load_port)
 
         # Baseline: bunker at load port (current behavior)
-        load_port_vlsfo_price = self.bunker_prices.get_price(cargo.load_port, 'VLSFO')
-        load_port_mgo_price = self.bunker_prices.get_price(cargo.load_port, 'MGO')
+        load_port_vlsfo_price = self._price(cargo.load_port, 'VLSFO')
+        load_port_mgo_price = self._price(cargo.load_port, 'MGO')
         baseline_cost = (
             bunker_needed_vlsfo * load_port_vlsfo_price +
             bunker_needed_mgo * load_port_mgo_price +
             5000.0  # Lumpsum fee
         )
 
-        # Evaluate each candidate
+        # Route distances and prices for all candidates (NaN = unavailable);
+        # tuple() is a no-op for the ALL_BUNKER_PORTS tuple
+        candidates = tuple(candidates)
+        leg1_arr = self._candidate_legs(candidates, vessel.current_port, outbound=True)
+        leg2_arr = self._candidate_legs(candidates, cargo.load_port, outbound=False)
+        vlsfo_prices, mgo_prices = self._candidate_prices(candidates)
+
+        # Cost components for every candidate at once. Detour can be negative
+        # if the bunker port is on the way (then detour costs are savings).
+        lumpsum_fee = 5000.0
+        detour_days = ((leg1_arr + leg2_arr) - direct_distance) / (current_speed_ballast * 24)
+        bunker_fuel_cost = bunker_needed_vlsfo * vlsfo_prices + bunker_needed_mgo * mgo_prices
+        # Fuel cost per ballast sea day at each candidate's prices
+        sea_day_fuel_cost = (
+            fuel_consumption_rate_vlsfo * vlsfo_prices +
+            fuel_consumption_rate_mgo * mgo_prices
+        )
+        detour_fuel_cost = detour_days * sea_day_fuel_cost
+        detour_hire_cost = detour_days * hire_rate
+        total_cost_arr = bunker_fuel_cost + lumpsum_fee + detour_fuel_cost + detour_hire_cost
+
+        # Skip candidates with missing (NaN) or zero legs
+        valid = (leg1_arr * leg2_arr != 0) & ~np.isnan(leg1_arr + leg2_arr)
+
+        # Each pick can raise best_cost by under $1K (tiebreak), so a candidate
+        # at or above baseline + $1K per valid candidate can never be picked
+        n_valid = int(np.count_nonzero(valid))
+        eligible = np.flatnonzero(
+            valid & (total_cost_arr < baseline_cost + 1000 * n_valid)
+        ).tolist()
+        if not eligible:
+            return None, 0, direct_distance, 0.0, baseline_cost
+
+        # Sequential pick keeps the order-dependent $1K tiebreak exact
         best_port = None
         best_cost = baseline_cost
         best_leg1 = 0
         best_leg2 = direct_distance
         best_bunker_cost = baseline_cost
 
-        for bunker_port in candidates:
-            # Calculate route distances
-            leg1 = self.distances.get_distance(vessel.current_port, bunker_port)
-            leg2 = self.distances.get_distance(bunker_port, cargo.load_port)
-
-            if not leg1 or not leg2:
-                continue  # Skip if distances unavailable
-
-            # Calculate detour distance (can be negative if bunker port is on the way)
-            detour_distance = (leg1 + leg2) - direct_distance
-
-            # Get bunker prices at this port
-            vlsfo_price = self.bunker_prices.get_price(bunker_port, 'VLSFO')
-            mgo_price = self.bunker_prices.get_price(bunker_port, 'MGO')
-
-            # Cost components
-            bunker_fuel_cost = (
-                bunker_needed_vlsfo * vlsfo_price +
-                bunker_needed_mgo * mgo_price
-            )
-            lumpsum_fee = 5000.0
-
-            # Detour costs (if detour > 0)
-            if detour_distance > 0:
-                detour_days = detour_distance / (current_speed_ballast * 24)
-                detour_fuel_cost = (
-                    detour_days * fuel_consumption_rate_vlsfo * vlsfo_price +
-                    detour_days * fuel_consumption_rate_mgo * mgo_price
-                )
-                detour_hire_cost = detour_days * hire_rate
-            else:
-                # Negative detour = bunker port is on the way (saves distance)
-                detour_days = detour_distance / (current_speed_ballast * 24)  # Negative
-                detour_fuel_cost = (
-                    detour_days * fuel_consumption_rate_vlsfo * vlsfo_price +
-                    detour_days * fuel_consumption_rate_mgo * mgo_price
-                )  # Negative (savings)
-                detour_hire_cost = detour_days * hire_rate  # Negative (savings)
-
-            # Total cost
-            total_cost = bunker_fuel_cost + lumpsum_fee + detour_fuel_cost + detour_hire_cost
+        leg1s, leg2s = leg1_arr.tolist(), leg2_arr.tolist()
+        totals, fuel_costs = total_cost_arr.tolist(), bunker_fuel_cost.tolist()
+        for i in eligible:
+            total_cost, leg1, leg2 = totals[i], leg1s[i], leg2s[i]
 
             # Select if better (or equal cost but closer distance - tiebreaker)
             if total_cost < best_cost or (
@@ -1214,10 +1679,10 @@ class FreightCalculator:
                 (leg1 + leg2) < (best_leg1 + best_leg2)
             ):
                 best_cost = total_cost
-                best_port = bunker_port
+                best_port = candidates[i]
                 best_leg1 = leg1
                 best_leg2 = leg2
-                best_bunker_cost = bunker_fuel_cost + lumpsum_fee
+                best_bunker_cost = fuel_costs[i] + lumpsum_fee
 
         # Calculate savings vs baseline
         savings = baseline_cost - best_cost
@@ -1233,6 +1698,7 @@ class FreightCalculator:
         bunker_price_adjustment: float = 1.0,  # Multiplier for scenario analysis
         custom_ballast_distance: Optional[float] = None,
         custom_laden_distance: Optional[float] = None,
+        round_output: bool = True,
     ) -> VoyageResult:
         """
         Calculate complete voyage economics.
@@ -1245,20 +1711,26 @@ class FreightCalculator:
             bunker_price_adjustment: Multiplier for bunker prices (1.1 = +10%)
             custom_ballast_distance: Override ballast leg distance
             custom_laden_distance: Override laden leg distance
+            round_output: Round figures to 2 dp; False keeps raw floats for
+                search loops that only compare results (see VoyageResult.rounded)
         
         Returns:
             VoyageResult with all calculated values
         """
+        cfg = self.config
         
         # -----------------------------------------------------------------
         # 1. DISTANCES
         # -----------------------------------------------------------------
+        # Looked-up direct ballast distance, reused by the bunkering step
+        direct_ballast_distance = None
         if custom_ballast_distance:
             ballast_distance = custom_ballast_distance
         else:
             ballast_distance = self.distances.get_distance(vessel.current_port, cargo.load_port)
             if ballast_distance is None:
                 raise ValueError(f"Cannot find distance: {vessel.current_port} → {cargo.load_port}")
+            direct_ballast_distance = ballast_distance
         
         if custom_laden_distance:
             laden_distance = custom_laden_distance
@@ -1294,9 +1766,8 @@ class FreightCalculator:
         # -----------------------------------------------------------------
         # Owner's option: can load up to quantity * (1 + tolerance)
         # But limited by vessel capacity (DWT minus bunkers/stores/constants)
-        max_by_cargo = int(cargo.quantity * (1 + cargo.quantity_tolerance))
-        min_by_cargo = int(cargo.quantity * (1 - cargo.quantity_tolerance))
-        max_by_vessel = vessel.dwt - self.config.vessel_constants
+        max_by_cargo, min_by_cargo = _cargo_qty_bounds(cargo.quantity, cargo.quantity_tolerance)
+        max_by_vessel = vessel.dwt - cfg.vessel_constants
 
         # Maximize cargo within constraints (owner's option to load more)
         total_cargo_qty = min(max_by_cargo, max_by_vessel)
@@ -1322,7 +1793,7 @@ class FreightCalculator:
         discharge_days = total_cargo_qty / cargo.discharge_rate + cargo.discharge_turn_time / 24
 
         # Add scenario delay (configurable split between load/discharge ports)
-        load_delay_fraction = self.config.port_delay_load_fraction
+        load_delay_fraction = cfg.port_delay_load_fraction
         load_days += extra_port_delay_days * load_delay_fraction
         discharge_days += extra_port_delay_days * (1 - load_delay_fraction)
         
@@ -1374,12 +1845,9 @@ class FreightCalculator:
         # 8. BUNKER COSTS
         # -----------------------------------------------------------------
         # Get bunker prices (use load port region for simplicity)
-        vlsfo_price = self.bunker_prices.get_price(cargo.load_port, 'VLSFO') * bunker_price_adjustment
-        mgo_price = self.bunker_prices.get_price(cargo.load_port, 'MGO') * bunker_price_adjustment
-        
-        bunker_cost_vlsfo = vlsfo_consumed * vlsfo_price
-        bunker_cost_mgo = mgo_consumed * mgo_price
-        total_bunker_cost = bunker_cost_vlsfo + bunker_cost_mgo
+        vlsfo_price = self._price(cargo.load_port, 'VLSFO') * bunker_price_adjustment
+        mgo_price = self._price(cargo.load_port, 'MGO') * bunker_price_adjustment
+        # Costs are priced once, after 8a settles the bunker port and quantities
         
         # Bunker needed (vs remaining on board)
         bunker_needed_vlsfo = max(0, vlsfo_consumed - vessel.bunker_rob_vlsfo)
@@ -1390,7 +1858,7 @@ class FreightCalculator:
         # -----------------------------------------------------------------
 
         total_bunker_needed = bunker_needed_vlsfo + bunker_needed_mgo
-        needs_bunkering = total_bunker_needed > self.config.bunker_threshold_mt
+        needs_bunkering = total_bunker_needed > cfg.bunker_threshold_mt
 
         if needs_bunkering:
             # Find optimal bunker port
@@ -1409,6 +1877,7 @@ class FreightCalculator:
                 fuel_consumption_rate_vlsfo=fuel_ballast_vlsfo,
                 fuel_consumption_rate_mgo=fuel_ballast_mgo,
                 hire_rate=vessel.hire_rate,
+                direct_distance=direct_ballast_distance,
             )
 
             # Update ballast distance to use explicit routing
@@ -1430,8 +1899,8 @@ class FreightCalculator:
                 bunker_needed_mgo = max(0, mgo_consumed - vessel.bunker_rob_mgo)
 
                 # Get bunker prices at selected port
-                vlsfo_price = self.bunker_prices.get_price(selected_bunker_port, 'VLSFO') * bunker_price_adjustment
-                mgo_price = self.bunker_prices.get_price(selected_bunker_port, 'MGO') * bunker_price_adjustment
+                vlsfo_price = self._price(selected_bunker_port, 'VLSFO') * bunker_price_adjustment
+                mgo_price = self._price(selected_bunker_port, 'MGO') * bunker_price_adjustment
             else:
                 # Fallback: use load port as bunker location
                 selected_bunker_port = cargo.load_port
@@ -1451,15 +1920,11 @@ class FreightCalculator:
             mgo_consumed += extra_mgo_for_bunker
             total_days += extra_bunkering_days
 
-            # Recalculate costs with selected bunker port prices
-            bunker_cost_vlsfo = vlsfo_consumed * vlsfo_price
-            bunker_cost_mgo = mgo_consumed * mgo_price
-            total_bunker_cost = bunker_cost_vlsfo + bunker_cost_mgo
-
             # Store original direct distance for reporting
-            direct_ballast_distance = self.distances.get_distance(
-                vessel.current_port, cargo.load_port
-            )
+            if direct_ballast_distance is None:
+                direct_ballast_distance = self.distances.get_distance(
+                    vessel.current_port, cargo.load_port
+                )
             if direct_ballast_distance is None:
                 direct_ballast_distance = ballast_distance
 
@@ -1475,6 +1940,11 @@ class FreightCalculator:
             bunkering_lumpsum_fee = 0.0
             num_bunkering_stops = 0
 
+        # Bunker costs at the final (load port or selected bunker port) prices
+        bunker_cost_vlsfo = vlsfo_consumed * vlsfo_price
+        bunker_cost_mgo = mgo_consumed * mgo_price
+        total_bunker_cost = bunker_cost_vlsfo + bunker_cost_mgo
+
         # -----------------------------------------------------------------
         # 9. REVENUE
         # -----------------------------------------------------------------
@@ -1498,7 +1968,7 @@ class FreightCalculator:
         port_costs = cargo.port_cost_load + cargo.port_cost_discharge
 
         # Miscellaneous (canal fees, surveys, etc.)
-        misc_costs = self.config.misc_costs
+        misc_costs = cfg.misc_costs
         
         # -----------------------------------------------------------------
         # 11. PROFIT CALCULATION
@@ -1517,71 +1987,371 @@ class FreightCalculator:
         # TCE = (Net Freight - Voyage Costs) / Total Days
         # Voyage costs = bunker + port costs (exclude hire)
         voyage_costs = total_bunker_cost + port_costs + misc_costs
-        tce = (net_freight - voyage_costs) / total_days if total_days > self.config.min_voyage_days else 0
+        tce = (net_freight - voyage_costs) / total_days if total_days > cfg.min_voyage_days else 0
         
         # -----------------------------------------------------------------
         # 13. BUILD RESULT
         # -----------------------------------------------------------------
-        return VoyageResult(
+        result = VoyageResult(
             vessel_name=vessel.name,
             cargo_name=cargo.name,
             
             # Timing
-            ballast_days=round(ballast_days, 2),
-            laden_days=round(laden_days, 2),
-            load_days=round(load_days, 2),
-            discharge_days=round(discharge_days, 2),
-            total_days=round(total_days, 2),
+            ballast_days=ballast_days,
+            laden_days=laden_days,
+            load_days=load_days,
+            discharge_days=discharge_days,
+            total_days=total_days,
             
             # Laycan
             arrival_date=arrival_at_loadport,
             laycan_start=laycan_start,
             laycan_end=laycan_end,
             can_make_laycan=can_make_laycan,
-            waiting_days=round(waiting_days, 2),
+            waiting_days=waiting_days,
             
             # Cargo
             cargo_quantity=total_cargo_qty,
             
             # Revenue
-            gross_freight=round(gross_freight, 2),
-            commission_cost=round(commission_cost, 2),
-            net_freight=round(net_freight, 2),
+            gross_freight=gross_freight,
+            commission_cost=commission_cost,
+            net_freight=net_freight,
             
             # Costs
-            bunker_cost_vlsfo=round(bunker_cost_vlsfo, 2),
-            bunker_cost_mgo=round(bunker_cost_mgo, 2),
-            total_bunker_cost=round(total_bunker_cost, 2),
-            hire_cost=round(hire_cost, 2),
-            port_costs=round(port_costs, 2),
-            misc_costs=round(misc_costs, 2),
-            total_costs=round(total_costs, 2),
+            bunker_cost_vlsfo=bunker_cost_vlsfo,
+            bunker_cost_mgo=bunker_cost_mgo,
+            total_bunker_cost=total_bunker_cost,
+            hire_cost=hire_cost,
+            port_costs=port_costs,
+            misc_costs=misc_costs,
+            total_costs=total_costs,
             
             # Profit
-            gross_profit=round(gross_profit, 2),
-            net_profit=round(net_profit, 2),
-            tce=round(tce, 2),
+            gross_profit=gross_profit,
+            net_profit=net_profit,
+            tce=tce,
             
             # Fuel
-            vlsfo_consumed=round(vlsfo_consumed, 2),
-            mgo_consumed=round(mgo_consumed, 2),
-            bunker_needed_vlsfo=round(bunker_needed_vlsfo, 2),
-            bunker_needed_mgo=round(bunker_needed_mgo, 2),
+            vlsfo_consumed=vlsfo_consumed,
+            mgo_consumed=mgo_consumed,
+            bunker_needed_vlsfo=bunker_needed_vlsfo,
+            bunker_needed_mgo=bunker_needed_mgo,
 
             # Bunkering stop information
             num_bunkering_stops=num_bunkering_stops,
-            extra_bunkering_days=round(extra_bunkering_days, 2),
-            bunkering_lumpsum_fee=round(bunkering_lumpsum_fee, 2),
-            extra_mgo_for_bunker=round(extra_mgo_for_bunker, 2),
+            extra_bunkering_days=extra_bunkering_days,
+            bunkering_lumpsum_fee=bunkering_lumpsum_fee,
+            extra_mgo_for_bunker=extra_mgo_for_bunker,
 
             # Explicit bunkering port routing
             selected_bunker_port=selected_bunker_port,
-            bunker_port_savings=round(bunker_savings, 2),
-            ballast_leg_to_bunker=round(leg1_distance, 2),
-            bunker_to_load_leg=round(leg2_distance, 2),
-            direct_ballast_distance=round(direct_ballast_distance, 2),
-            bunker_fuel_vlsfo_qty=round(bunker_needed_vlsfo, 2),
-            bunker_fuel_mgo_qty=round(bunker_needed_mgo, 2),
+            bunker_port_savings=bunker_savings,
+            ballast_leg_to_bunker=leg1_distance,
+            bunker_to_load_leg=leg2_distance,
+            direct_ballast_distance=direct_ballast_distance,
+            bunker_fuel_vlsfo_qty=bunker_needed_vlsfo,
+            bunker_fuel_mgo_qty=bunker_needed_mgo,
+        )
+        return result._round_in_place() if round_output else result
+
+    def calculate_voyage_batch(
+        self,
+        vessels: List[Vessel],
+        cargoes: List[Cargo],
+        use_eco_speed: bool = False,
+        extra_port_delay_days: float = 0,
+        bunker_price_adjustment: float = 1.0,
+    ) -> VoyageResultBuffer:
+        """
+        Calculate voyage economics for every (vessel, cargo) pair at once.
+
+        Same model as calculate_voyage, evaluated on (n_vessels, n_cargoes)
+        NumPy arrays instead of one VoyageResult per pair. Values are not
+        rounded. Pairs calculate_voyage would reject (distance not found,
+        minimum cargo not met) have valid=False and NaN metrics.
+
+        Returns:
+            VoyageResultBuffer of 2-D arrays keyed like the VoyageResult
+            fields, plus 'valid'. 'arrival_date' is datetime64[us];
+            'selected_bunker_port' is an object array (None when no
+            bunkering stop). Use .row(i, j) for a rounded VoyageResult.
+        """
+        cfg = self.config
+        adj = bunker_price_adjustment
+        nv, nc = len(vessels), len(cargoes)
+
+        vessel_cols = fleet_arrays(tuple(vessels))
+        cargo_cols = fleet_arrays(tuple(cargoes))
+
+        def vcol(attr: str) -> np.ndarray:
+            return vessel_cols[attr][:, None]
+
+        def ccol(attr: str) -> np.ndarray:
+            return cargo_cols[attr][None, :]
+
+        # -----------------------------------------------------------------
+        # 1. DISTANCES
+        # -----------------------------------------------------------------
+        ballast_distance = self.distances.lookup_many(
+            [v.current_port for v in vessels for _ in cargoes],
+            [c.load_port for _ in vessels for c in cargoes],
+        ).reshape(nv, nc)
+        laden_distance = self.distances.lookup_many(
+            [c.load_port for c in cargoes], [c.discharge_port for c in cargoes]
+        )[None, :]
+
+        # -----------------------------------------------------------------
+        # 2. SPEEDS AND STEAMING TIMES
+        # -----------------------------------------------------------------
+        eco = '_eco' if use_eco_speed else ''
+        speed_ballast = vcol(f'speed_ballast{eco}')
+        speed_laden = vcol(f'speed_laden{eco}')
+        fuel_ballast_vlsfo = vcol(f'fuel_ballast{eco}_vlsfo')
+        fuel_ballast_mgo = vcol(f'fuel_ballast{eco}_mgo')
+        fuel_laden_vlsfo = vcol(f'fuel_laden{eco}_vlsfo')
+        fuel_laden_mgo = vcol(f'fuel_laden{eco}_mgo')
+
+        ballast_days = ballast_distance / (speed_ballast * 24)
+        laden_days = laden_distance / (speed_laden * 24)
+
+        # -----------------------------------------------------------------
+        # 3. CARGO QUANTITY
+        # -----------------------------------------------------------------
+        quantity = ccol('quantity')
+        tolerance = ccol('quantity_tolerance')
+        max_by_cargo = np.trunc(quantity * (1 + tolerance))
+        min_by_cargo = np.trunc(quantity * (1 - tolerance))
+        max_by_vessel = vcol('dwt') - cfg.vessel_constants
+        total_cargo_qty = np.minimum(max_by_cargo, max_by_vessel)
+
+        valid = (
+            ~np.isnan(ballast_distance) & ~np.isnan(laden_distance)
+            & (total_cargo_qty >= min_by_cargo)
+        )
+
+        threshold = np.array(
+            [c.half_freight_threshold or 0 for c in cargoes], dtype=float
+        )[None, :]
+        over_threshold = (threshold > 0) & (total_cargo_qty > threshold)
+        full_freight_qty = np.where(over_threshold, threshold, total_cargo_qty)
+        half_freight_qty = np.where(over_threshold, total_cargo_qty - threshold, 0.0)
+
+        # -----------------------------------------------------------------
+        # 4. PORT TIME
+        # -----------------------------------------------------------------
+        load_turn_time = ccol('load_turn_time')
+        discharge_turn_time = ccol('discharge_turn_time')
+        load_days = total_cargo_qty / ccol('load_rate') + load_turn_time / 24
+        discharge_days = total_cargo_qty / ccol('discharge_rate') + discharge_turn_time / 24
+
+        load_delay_fraction = cfg.port_delay_load_fraction
+        load_days = load_days + extra_port_delay_days * load_delay_fraction
+        discharge_days = discharge_days + extra_port_delay_days * (1 - load_delay_fraction)
+
+        # -----------------------------------------------------------------
+        # 5. LAYCAN CHECK (microsecond resolution, like datetime)
+        # -----------------------------------------------------------------
+        etd = np.array([
+            self._parse_date(v.etd, f"vessel {v.name} ETD") for v in vessels
+        ], dtype='datetime64[us]')[:, None]
+        laycan_start = np.array([
+            self._parse_date(c.laycan_start, f"cargo {c.name} laycan_start") for c in cargoes
+        ], dtype='datetime64[us]')[None, :]
+        laycan_end = np.array([
+            self._parse_date(c.laycan_end, f"cargo {c.name} laycan_end") for c in cargoes
+        ], dtype='datetime64[us]')[None, :]
+
+        ballast_us = np.round(np.where(valid, ballast_days, 0.0) * 86400e6)
+        arrival_at_loadport = etd + ballast_us.astype('timedelta64[us]')
+        can_make_laycan = arrival_at_loadport <= laycan_end
+
+        early_us = (laycan_start - arrival_at_loadport).astype(np.int64)
+        waiting_days = np.where(arrival_at_loadport < laycan_start, (early_us / 1e6) / 86400, 0.0)
+
+        # -----------------------------------------------------------------
+        # 6. TOTAL VOYAGE DURATION
+        # -----------------------------------------------------------------
+        total_days = ballast_days + waiting_days + load_days + laden_days + discharge_days
+
+        # -----------------------------------------------------------------
+        # 7. FUEL CONSUMPTION
+        # -----------------------------------------------------------------
+        port_idle_mgo = vcol('port_idle_mgo')
+        turn_days = (load_turn_time + discharge_turn_time) / 24
+
+        vlsfo_laden = laden_days * fuel_laden_vlsfo
+        mgo_laden = laden_days * fuel_laden_mgo
+        working_days = load_days + discharge_days - turn_days
+        mgo_working = working_days * vcol('port_working_mgo')
+        idle_days = waiting_days + turn_days
+        mgo_idle = idle_days * port_idle_mgo
+
+        rob_vlsfo = vcol('bunker_rob_vlsfo')
+        rob_mgo = vcol('bunker_rob_mgo')
+
+        def ballast_fuel(ballast_days):
+            vlsfo_consumed = ballast_days * fuel_ballast_vlsfo + vlsfo_laden
+            mgo_consumed = ballast_days * fuel_ballast_mgo + mgo_laden + mgo_working + mgo_idle
+            return (
+                vlsfo_consumed, mgo_consumed,
+                np.maximum(0, vlsfo_consumed - rob_vlsfo),
+                np.maximum(0, mgo_consumed - rob_mgo),
+            )
+
+        vlsfo_consumed, mgo_consumed, bunker_needed_vlsfo, bunker_needed_mgo = \
+            ballast_fuel(ballast_days)
+
+        # -----------------------------------------------------------------
+        # 8. BUNKER PRICES (load port unless a bunker port is selected)
+        # -----------------------------------------------------------------
+        vlsfo_price = np.repeat(
+            np.array([self._price(c.load_port, 'VLSFO') for c in cargoes])[None, :] * adj,
+            nv, axis=0,
+        )
+        mgo_price = np.repeat(
+            np.array([self._price(c.load_port, 'MGO') for c in cargoes])[None, :] * adj,
+            nv, axis=0,
+        )
+
+        # -----------------------------------------------------------------
+        # 8a. BUNKERING PORT SELECTION (per pair; see find_optimal_bunker_port)
+        # -----------------------------------------------------------------
+        needs_bunkering = valid & (
+            bunker_needed_vlsfo + bunker_needed_mgo > cfg.bunker_threshold_mt
+        )
+        direct_ballast_distance = ballast_distance
+        selected_bunker_port = np.full((nv, nc), None, dtype=object)
+        leg1_distance = np.zeros((nv, nc))
+        leg2_distance = ballast_distance.copy()
+        bunker_savings = np.zeros((nv, nc))
+
+        for i, j in zip(*np.nonzero(needs_bunkering)):
+            vessel, cargo = vessels[i], cargoes[j]
+            port, leg1, leg2, savings, _ = self.find_optimal_bunker_port(
+                vessel=vessel,
+                cargo=cargo,
+                bunker_needed_vlsfo=bunker_needed_vlsfo[i, j].item(),
+                bunker_needed_mgo=bunker_needed_mgo[i, j].item(),
+                current_speed_ballast=speed_ballast[i, 0].item(),
+                fuel_consumption_rate_vlsfo=fuel_ballast_vlsfo[i, 0].item(),
+                fuel_consumption_rate_mgo=fuel_ballast_mgo[i, 0].item(),
+                hire_rate=vessel.hire_rate,
+                direct_distance=ballast_distance[i, j].item(),
+            )
+            if port:
+                selected_bunker_port[i, j] = port
+                leg1_distance[i, j] = leg1
+                leg2_distance[i, j] = leg2
+                bunker_savings[i, j] = savings
+                vlsfo_price[i, j] = self._price(port, 'VLSFO') * adj
+                mgo_price[i, j] = self._price(port, 'MGO') * adj
+            else:
+                # Fallback: use load port as bunker location
+                selected_bunker_port[i, j] = cargo.load_port
+
+        # Rerouted pairs sail via the bunker port; others keep the direct leg
+        rerouted = needs_bunkering & (leg1_distance != 0)
+        if rerouted.any():
+            ballast_distance = np.where(rerouted, leg1_distance + leg2_distance, ballast_distance)
+            ballast_days = np.where(rerouted, ballast_distance / (speed_ballast * 24), ballast_days)
+            vlsfo_consumed, mgo_consumed, bunker_needed_vlsfo, bunker_needed_mgo = \
+                ballast_fuel(ballast_days)
+
+        # Bunkering stop costs
+        extra_bunkering_days = np.where(needs_bunkering, 1.0, 0.0)
+        extra_mgo_for_bunker = np.where(needs_bunkering, 1.0 * port_idle_mgo, 0.0)
+        bunkering_lumpsum_fee = np.where(needs_bunkering, 5000.0, 0.0)
+        num_bunkering_stops = needs_bunkering.astype(int)
+
+        mgo_consumed = mgo_consumed + extra_mgo_for_bunker
+        total_days = total_days + extra_bunkering_days
+
+        bunker_cost_vlsfo = vlsfo_consumed * vlsfo_price
+        bunker_cost_mgo = mgo_consumed * mgo_price
+        total_bunker_cost = bunker_cost_vlsfo + bunker_cost_mgo
+
+        # -----------------------------------------------------------------
+        # 9. REVENUE
+        # -----------------------------------------------------------------
+        freight_rate = ccol('freight_rate')
+        gross_freight = full_freight_qty * freight_rate
+        gross_freight = np.where(
+            half_freight_qty > 0, gross_freight + half_freight_qty * freight_rate * 0.5, gross_freight
+        )
+        commission_cost = gross_freight * ccol('commission')
+        net_freight = gross_freight - commission_cost
+
+        # -----------------------------------------------------------------
+        # 10-12. COSTS, PROFIT, TCE
+        # -----------------------------------------------------------------
+        is_cargill = np.array([v.is_cargill for v in vessels])[:, None]
+        hire_cost = np.where(is_cargill, total_days * vcol('hire_rate'), 0.0)
+        port_costs = np.broadcast_to(ccol('port_cost_load') + ccol('port_cost_discharge'), (nv, nc))
+        misc_costs = np.full((nv, nc), float(cfg.misc_costs))
+
+        total_costs = total_bunker_cost + hire_cost + port_costs + misc_costs + bunkering_lumpsum_fee
+        gross_profit = net_freight - total_bunker_cost - port_costs - misc_costs
+        net_profit = net_freight - total_costs
+
+        voyage_costs = total_bunker_cost + port_costs + misc_costs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tce = np.where(
+                total_days > cfg.min_voyage_days, (net_freight - voyage_costs) / total_days, 0.0
+            )
+
+        # -----------------------------------------------------------------
+        # 13. BUILD RESULT ARRAYS
+        # -----------------------------------------------------------------
+        def out(values) -> np.ndarray:
+            return np.where(valid, np.broadcast_to(values, (nv, nc)), np.nan)
+
+        columns = {
+            'valid': valid,
+            'ballast_days': out(ballast_days),
+            'laden_days': out(laden_days),
+            'load_days': out(load_days),
+            'discharge_days': out(discharge_days),
+            'total_days': out(total_days),
+            'arrival_date': arrival_at_loadport,
+            'can_make_laycan': can_make_laycan & valid,
+            'waiting_days': out(waiting_days),
+            'cargo_quantity': out(total_cargo_qty),
+            'gross_freight': out(gross_freight),
+            'commission_cost': out(commission_cost),
+            'net_freight': out(net_freight),
+            'bunker_cost_vlsfo': out(bunker_cost_vlsfo),
+            'bunker_cost_mgo': out(bunker_cost_mgo),
+            'total_bunker_cost': out(total_bunker_cost),
+            'hire_cost': out(hire_cost),
+            'port_costs': out(port_costs),
+            'misc_costs': out(misc_costs),
+            'total_costs': out(total_costs),
+            'gross_profit': out(gross_profit),
+            'net_profit': out(net_profit),
+            'tce': out(tce),
+            'vlsfo_consumed': out(vlsfo_consumed),
+            'mgo_consumed': out(mgo_consumed),
+            'bunker_needed_vlsfo': out(bunker_needed_vlsfo),
+            'bunker_needed_mgo': out(bunker_needed_mgo),
+            'num_bunkering_stops': num_bunkering_stops,
+            'extra_bunkering_days': out(extra_bunkering_days),
+            'bunkering_lumpsum_fee': out(bunkering_lumpsum_fee),
+            'extra_mgo_for_bunker': out(extra_mgo_for_bunker),
+            'selected_bunker_port': selected_bunker_port,
+            'bunker_port_savings': out(bunker_savings),
+            'ballast_leg_to_bunker': out(leg1_distance),
+            'bunker_to_load_leg': out(leg2_distance),
+            'direct_ballast_distance': out(direct_ballast_distance),
+            'bunker_fuel_vlsfo_qty': out(bunker_needed_vlsfo),
+            'bunker_fuel_mgo_qty': out(bunker_needed_mgo),
+        }
+        return VoyageResultBuffer(
+            vessel_names=[v.name for v in vessels],
+            cargo_names=[c.name for c in cargoes],
+            laycan_start=laycan_start[0],
+            laycan_end=laycan_end[0],
+            columns=columns,
         )
 
 
@@ -1589,7 +2359,8 @@ class FreightCalculator:
 # DATA SETUP - CARGILL DATATHON 2026
 # =============================================================================
 
-def create_cargill_vessels() -> List[Vessel]:
+@functools.lru_cache(maxsize=1)
+def _cargill_vessels() -> Tuple[Vessel, ...]:
     """Create Cargill's 4 Capesize vessels from the datathon data."""
     
     vessels = [
@@ -1659,10 +2430,19 @@ def create_cargill_vessels() -> List[Vessel]:
         ),
     ]
     
-    return vessels
+    return tuple(vessels)
 
 
-def create_market_vessels() -> List[Vessel]:
+def create_cargill_vessels() -> List[Vessel]:
+    """
+    Cargill's 4 Capesize vessels as a fresh list. The instances are built once
+    and shared between calls, so treat them as read-only.
+    """
+    return list(_cargill_vessels())
+
+
+@functools.lru_cache(maxsize=1)
+def _market_vessels() -> Tuple[Vessel, ...]:
     """Create market vessels (3rd party) from the datathon data."""
     
     vessels = [
@@ -1811,10 +2591,16 @@ def create_market_vessels() -> List[Vessel]:
         ),
     ]
 
-    return vessels
+    return tuple(vessels)
 
 
-def create_cargill_cargoes() -> List[Cargo]:
+def create_market_vessels() -> List[Vessel]:
+    """Market vessels as a fresh list of shared, cached instances (read-only)."""
+    return list(_market_vessels())
+
+
+@functools.lru_cache(maxsize=1)
+def _cargill_cargoes() -> Tuple[Cargo, ...]:
     """Create Cargill's 3 committed cargoes from the datathon data."""
     
     cargoes = [
@@ -1881,10 +2667,16 @@ def create_cargill_cargoes() -> List[Cargo]:
         ),
     ]
     
-    return cargoes
+    return tuple(cargoes)
 
 
-def create_market_cargoes() -> List[Cargo]:
+def create_cargill_cargoes() -> List[Cargo]:
+    """Cargill's 3 committed cargoes as a fresh list of shared, cached instances (read-only)."""
+    return list(_cargill_cargoes())
+
+
+@functools.lru_cache(maxsize=1)
+def _market_cargoes() -> Tuple[Cargo, ...]:
     """Create market cargoes (3rd party) from the datathon data."""
     
     cargoes = [
@@ -1978,7 +2770,12 @@ def create_market_cargoes() -> List[Cargo]:
         ),
     ]
 
-    return cargoes
+    return tuple(cargoes)
+
+
+def create_market_cargoes() -> List[Cargo]:
+    """Market cargoes as a fresh list of shared, cached instances (read-only)."""
+    return list(_market_cargoes())
 
 
 # =============================================================================
@@ -2010,28 +2807,17 @@ def estimate_freight_rate(cargo: Cargo) -> float:
     return 15.0
 
 
+@functools.lru_cache(maxsize=256)
 def apply_estimated_freight_rate(cargo: Cargo) -> Cargo:
     """Return a new Cargo with an estimated freight rate applied.
 
     If the cargo already has a non-zero freight rate, return it unchanged.
+    Cached per (frozen, hashable) cargo, so repeat calls return the same copy.
     """
     if cargo.freight_rate != 0:
         return cargo
 
-    rate = estimate_freight_rate(cargo)
-    return Cargo(
-        name=cargo.name, customer=cargo.customer, commodity=cargo.commodity,
-        quantity=cargo.quantity, quantity_tolerance=cargo.quantity_tolerance,
-        laycan_start=cargo.laycan_start, laycan_end=cargo.laycan_end,
-        freight_rate=rate,
-        load_port=cargo.load_port, load_rate=cargo.load_rate,
-        load_turn_time=cargo.load_turn_time,
-        discharge_port=cargo.discharge_port, discharge_rate=cargo.discharge_rate,
-        discharge_turn_time=cargo.discharge_turn_time,
-        port_cost_load=cargo.port_cost_load, port_cost_discharge=cargo.port_cost_discharge,
-        commission=cargo.commission, is_cargill=cargo.is_cargill,
-        half_freight_threshold=cargo.half_freight_threshold,
-    )
+    return replace(cargo, freight_rate=estimate_freight_rate(cargo))
 
 
 def create_bunker_prices() -> BunkerPrices:
@@ -2051,107 +2837,3 @@ def create_bunker_prices() -> BunkerPrices:
     
     return prices
 
-
-# =============================================================================
-# MAIN - DEMONSTRATION
-# =============================================================================
-
-if __name__ == "__main__":
-    print("=" * 80)
-    print("CARGILL OCEAN TRANSPORTATION DATATHON 2026 - FREIGHT CALCULATOR")
-    print("=" * 80)
-    
-    # Initialize
-    distance_mgr = PortDistanceManager('Port_Distances.csv')
-    bunker_prices = create_bunker_prices()
-    calculator = FreightCalculator(distance_mgr, bunker_prices)
-    
-    # Load data
-    cargill_vessels = create_cargill_vessels()
-    cargill_cargoes = create_cargill_cargoes()
-    
-    print("\n📦 CARGILL VESSELS:")
-    for v in cargill_vessels:
-        print(f"  • {v.name:20} | DWT: {v.dwt:,} MT | At: {v.current_port:15} | ETD: {v.etd}")
-    
-    print("\n📦 CARGILL COMMITTED CARGOES:")
-    for c in cargill_cargoes:
-        print(f"  • {c.name[:40]:40} | {c.quantity:,} MT | Laycan: {c.laycan_start} - {c.laycan_end}")
-    
-    # Calculate all voyage combinations
-    print("\n" + "=" * 80)
-    print("VOYAGE ANALYSIS - ALL COMBINATIONS")
-    print("=" * 80)
-    
-    results = []
-    
-    for vessel in cargill_vessels:
-        for cargo in cargill_cargoes:
-            try:
-                result = calculator.calculate_voyage(vessel, cargo, use_eco_speed=True)
-                results.append(result)
-                
-                laycan_status = "✅ CAN MAKE" if result.can_make_laycan else "❌ CANNOT MAKE"
-                
-                print(f"\n{vessel.name} → {cargo.name[:35]}")
-                print(f"  Laycan: {laycan_status} (Arrives: {result.arrival_date.strftime('%d %b')})")
-                print(f"  Duration: {result.total_days:.1f} days (Ballast: {result.ballast_days:.1f} + Laden: {result.laden_days:.1f} + Port: {result.load_days + result.discharge_days:.1f})")
-                print(f"  Cargo: {result.cargo_quantity:,} MT")
-                print(f"  Revenue: ${result.net_freight:,.0f} (after {cargo.commission*100:.2f}% commission)")
-                print(f"  Bunker: ${result.total_bunker_cost:,.0f} ({result.vlsfo_consumed:.0f} MT VLSFO)")
-                print(f"  Port Costs: ${result.port_costs:,.0f}")
-                print(f"  Hire Cost: ${result.hire_cost:,.0f}")
-                print(f"  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-                print(f"  💰 TCE: ${result.tce:,.0f}/day | Net Profit: ${result.net_profit:,.0f}")
-                
-            except Exception as e:
-                print(f"\n{vessel.name} → {cargo.name[:35]}")
-                print(f"  ⚠️  Error: {e}")
-    
-    # Summary table
-    print("\n" + "=" * 80)
-    print("SUMMARY - TCE COMPARISON MATRIX (USD/day)")
-    print("=" * 80)
-    
-    # Create summary dataframe
-    summary_data = []
-    for r in results:
-        summary_data.append({
-            'Vessel': r.vessel_name,
-            'Cargo': r.cargo_name[:25],
-            'TCE': r.tce,
-            'Can Make Laycan': r.can_make_laycan,
-            'Net Profit': r.net_profit
-        })
-    
-    df = pd.DataFrame(summary_data)
-    print("\n")
-    print(df.to_string(index=False))
-    
-    # Best assignments
-    print("\n" + "=" * 80)
-    print("RECOMMENDED ASSIGNMENTS (Highest TCE)")
-    print("=" * 80)
-    
-    valid_results = [r for r in results if r.can_make_laycan]
-    if valid_results:
-        # Sort by TCE
-        valid_results.sort(key=lambda x: x.tce, reverse=True)
-        
-        assigned_vessels = set()
-        assigned_cargoes = set()
-        recommendations = []
-        
-        for r in valid_results:
-            if r.vessel_name not in assigned_vessels and r.cargo_name not in assigned_cargoes:
-                recommendations.append(r)
-                assigned_vessels.add(r.vessel_name)
-                assigned_cargoes.add(r.cargo_name)
-        
-        total_profit = 0
-        for r in recommendations:
-            print(f"\n✅ {r.vessel_name} → {r.cargo_name[:35]}")
-            print(f"   TCE: ${r.tce:,.0f}/day | Profit: ${r.net_profit:,.0f}")
-            total_profit += r.net_profit
-        
-        print(f"\n💰 TOTAL PORTFOLIO PROFIT: ${total_profit:,.0f}")
@@ -153,6 +153,7 @@ class PortCongestionPredictor:
         model_path: Optional[str] = None,
         data_path: Optional[str] = None,
         port_database_path: Optional[str] = None,
+        activity_df: Optional[pd.DataFrame] = None,
     ):
         """
         Initialize the predictor.
@@ -161,6 +162,9 @@ class PortCongestionPredictor:
             model_path: Path to saved LightGBM model (.joblib)
             data_path: Path to Daily_Port_Activity_Data_and_Trade_Estimates.csv
             port_database_path: Path to PortWatch_ports_database.csv
+            activity_df: Already-loaded port activity data. If given, it is
+                used instead of reading data_path. The caller's frame is
+                not modified.
         """
         self.model = None
         self.model_path = model_path
@@ -173,7 +177,9 @@ class PortCongestionPredictor:
             self._load_model(model_path)
 
         # Load data for feature creation
-        if data_path and os.path.exists(data_path):
+        if activity_df is not None:
+            self._set_data(activity_df)
+        elif data_path and os.path.exists(data_path):
             self._load_data(data_path)
 
     def _load_model(self, path: str) -> bool:
@@ -192,14 +198,18 @@ class PortCongestionPredictor:
     def _load_data(self, path: str) -> bool:
         """Load port activity data for feature creation."""
         try:
-            df = pd.read_csv(path)
-            df['date'] = pd.to_datetime(df['date'])
-            self._data_cache = df
-            return True
+            return self._set_data(pd.read_csv(path))
         except Exception as e:
             print(f"Warning: Could not load data from {path}: {e}")
             return False
 
+    def _set_data(self, df: pd.DataFrame) -> bool:
+        """Use an in-memory port activity DataFrame for feature creation."""
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df = df.assign(date=pd.to_datetime(df['date']))
+        self._data_cache = df
+        return True
+
     def is_model_available(self) -> bool:
         """Check if ML model is loaded and ready."""
         return self.model is not None
@@ -0,0 +1,175 @@
+"""
+Test script for the batch distance lookups in PortDistanceManager.
+
+Checks lookup_many() against one scalar get_distance() call per pair:
+distances, NaN for unknown ports, and lookup stats for repeated pairs.
+Checks get_distances_batch() cell by cell against the lookup precedence
+(same port 0, CSV, CSV reverse, estimate, else NaN) and scalar lookups.
+"""
+
+import logging
+import random
+import sys
+sys.path.insert(0, '.')
+
+import numpy as np
+
+from src.freight_calculator import DistanceSource, PortDistanceManager
+
+CSV_PATH = 'data/Port_Distances.csv'
+
+# Misses are expected below; keep the NOT FOUND warnings out of the output
+logging.getLogger('PortDistanceManager').setLevel(logging.ERROR)
+
+# Free-form names covering CSV, CSV reverse, estimated and unknown pairs
+SAMPLE_PAIRS = [
+    ('kamsar anchorage', 'Qingdao'),     # CSV
+    ('QINGDAO', 'Kamsar'),               # CSV reverse (via alias)
+    ('ITAGUAI', 'QINGDAO'),              # CSV
+    ('QINGDAO', 'ITAGUAI'),              # CSV reverse
+    ('Port Hedland', 'Singapore'),       # estimate
+    ('PORT LOUIS', 'SALDANHA BAY'),      # estimate (reverse of table entry)
+    ('MAP TA PHUT', 'Fujairah'),         # estimate
+    ('QINGDAO', 'QINGDAO'),              # same port
+    ('Nowhere', 'QINGDAO'),              # unknown
+    ('QINGDAO', 'Atlantis'),             # unknown
+]
+
+
+def _same(a, b):
+    """Equal floats, or both missing (None/NaN)."""
+    a_missing = a is None or (isinstance(a, float) and np.isnan(a))
+    b_missing = b is None or (isinstance(b, float) and np.isnan(b))
+    return a_missing == b_missing and (a_missing or a == b)
+
+
+def test_lookup_many_matches_scalar():
+    """lookup_many gives the scalar distance for every pair, repeats included."""
+    # Every pair three times, interleaved, so the dedupe/bincount path runs
+    pairs = SAMPLE_PAIRS * 3
+    from_ports = [a for a, _ in pairs]
+    to_ports = [b for _, b in pairs]
+
+    batch_dm = PortDistanceManager(CSV_PATH)
+    scalar_dm = PortDistanceManager(CSV_PATH)
+
+    result = batch_dm.lookup_many(from_ports, to_ports)
+    assert result.shape == (len(pairs),)
+    assert result.dtype == np.float64
+
+    for k, (a, b) in enumerate(pairs):
+        expected = scalar_dm.get_distance(a, b)
+        assert _same(result[k].item(), expected), (a, b, result[k], expected)
+
+    # Unknown ports come back as NaN
+    assert np.isnan(result[from_ports.index('Nowhere')])
+    assert np.isnan(result[to_ports.index('Atlantis')])
+
+    # Stats count every pair, exactly as one get_distance call per pair would
+    assert batch_dm.get_lookup_stats() == scalar_dm.get_lookup_stats()
+    assert batch_dm.get_lookup_stats()['total_lookups'] == len(pairs)
+    print(f"[OK] lookup_many matches get_distance for {len(pairs)} pairs")
+
+
+def test_lookup_many_empty_and_length_mismatch():
+    """Empty input gives an empty array; mismatched lengths raise ValueError."""
+    dm = PortDistanceManager(CSV_PATH)
+    assert dm.lookup_many([], []).shape == (0,)
+    assert dm.get_lookup_stats()['total_lookups'] == 0
+
+    try:
+        dm.lookup_many(['QINGDAO', 'ITAGUAI'], ['ITAGUAI'])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("lookup_many accepted mismatched lengths")
+    print("[OK] lookup_many handles empty input and rejects mismatched lengths")
+
+
+def _known_table_names(dm):
+    """Every exact port name in the CSV routes or the estimate table."""
+    names = set(dm.distances)
+    for row in dm.distances.values():
+        names.update(row)
+    for pair in dm.estimated_distances:
+        names.update(pair)
+    return names
+
+
+def _expected_table_distance(dm, known, port_from, port_to):
+    """Distance for two exact table names by lookup precedence (None if unknown)."""
+    if port_from not in known or port_to not in known:
+        return None
+    if port_from == port_to:
+        return 0.0
+    csv_row = dm.distances.get(port_from, {})
+    if port_to in csv_row:
+        return csv_row[port_to]
+    csv_row = dm.distances.get(port_to, {})
+    if port_from in csv_row:
+        return csv_row[port_from]
+    for key in ((port_from, port_to), (port_to, port_from)):
+        if key in dm.estimated_distances:
+            return float(dm.estimated_distances[key])
+    return None
+
+
+def test_get_distances_batch_matches_lookups():
+    """Every cell of the dense gather matches precedence and scalar lookups."""
+    dm = PortDistanceManager(CSV_PATH)
+
+    # Voyage/bunker ports, estimate-only ports, an unknown name and a fixed
+    # random sample of CSV ports
+    ports = [
+        'QINGDAO', 'KAMSAR ANCHORAGE', 'ITAGUAI', 'PORT HEDLAND', 'SINGAPORE',
+        'FUJAIRAH', 'MAP TA PHUT', 'SALDANHA BAY', 'PORT LOUIS', 'ROTTERDAM',
+        'GWANGYANG', 'VANCOUVER', 'NOWHERE',
+    ]
+    rng = random.Random(42)
+    ports += rng.sample(sorted(dm.distances), 40)
+
+    from_ports = [a for a in ports for _ in ports]
+    to_ports = [b for _ in ports for b in ports]
+    result = dm.get_distances_batch(from_ports, to_ports)
+    assert result.shape == (len(from_ports),)
+
+    known = _known_table_names(dm)
+    sources = {}
+    checked_scalar = 0
+    for k, (a, b) in enumerate(zip(from_ports, to_ports)):
+        got = result[k].item()
+        expected = _expected_table_distance(dm, known, a, b)
+        assert _same(got, expected), (a, b, got, expected)
+
+        # Scalar lookups alias-match free-form names; compare wherever they
+        # resolved to exactly these table names. Unknown names are NaN in the
+        # batch gather even for a same-port pair, where get_distance gives 0.
+        distance, source, matched_from, matched_to = dm.get_distance_with_source(a, b)
+        if a not in known or b not in known:
+            assert np.isnan(got), (a, b, got)
+        elif source == DistanceSource.NOT_FOUND or {matched_from, matched_to} == {a, b}:
+            assert _same(got, distance), (a, b, got, distance, source)
+            checked_scalar += 1
+        sources[source] = sources.get(source, 0) + 1
+
+    # The sample must actually exercise every branch
+    for source in (DistanceSource.CSV, DistanceSource.CSV_REVERSE,
+                   DistanceSource.ESTIMATE, DistanceSource.NOT_FOUND):
+        assert sources.get(source), f"sample has no {source} pairs"
+    assert np.isnan(result[from_ports.index('NOWHERE')])
+
+    # Batch gathers do not touch the lookup stats, and names are case-folded
+    stats_before = dm.get_lookup_stats()
+    mixed = dm.get_distances_batch(['Kamsar Anchorage', 'qingdao'], ['Qingdao', 'itaguai'])
+    assert dm.get_lookup_stats() == stats_before
+    assert mixed.tolist() == dm.get_distances_batch(
+        ['KAMSAR ANCHORAGE', 'QINGDAO'], ['QINGDAO', 'ITAGUAI']).tolist()
+
+    print(f"[OK] get_distances_batch matches precedence for {len(from_ports)} cells "
+          f"({checked_scalar} also checked against get_distance_with_source)")
+
+
+if __name__ == '__main__':
+    test_lookup_many_matches_scalar()
+    test_lookup_many_empty_and_length_mismatch()
+    test_get_distances_batch_matches_lookups()
@@ -0,0 +1,149 @@
+"""
+Test script for FreightCalculator.calculate_voyage_batch.
+
+The batch path re-implements calculate_voyage on NumPy arrays, so this checks
+the two stay in step: over the Cargill + market vessel x cargo grid, at eco
+and normal speed, with and without a price/delay scenario, batch.row(i, j)
+must equal calculate_voyage(...) and be None exactly where it raises.
+Also checks the VoyageResultBuffer it returns: column access, the valid
+mask, NaN in invalid cells and row() rounding.
+"""
+
+import dataclasses
+import logging
+import sys
+from datetime import datetime
+sys.path.insert(0, '.')
+
+import numpy as np
+
+from src.freight_calculator import (
+    FreightCalculator, PortDistanceManager, VoyageResult, apply_estimated_freight_rate,
+    create_bunker_prices, create_cargill_cargoes, create_cargill_vessels,
+    create_market_cargoes, create_market_vessels,
+)
+
+CSV_PATH = 'data/Port_Distances.csv'
+
+# Some grid pairs have no distance data; keep the NOT FOUND warnings quiet
+logging.getLogger('PortDistanceManager').setLevel(logging.ERROR)
+
+# (bunker_price_adjustment, extra_port_delay_days)
+SCENARIOS = [(1.0, 0), (1.3, 5)]
+
+
+def _build_grid():
+    """Calculator plus the full vessel and cargo lists used by the demo."""
+    dm = PortDistanceManager(CSV_PATH)
+    calc = FreightCalculator(dm, create_bunker_prices())
+    vessels = create_cargill_vessels() + create_market_vessels()
+    cargoes = [apply_estimated_freight_rate(c)
+               for c in create_cargill_cargoes() + create_market_cargoes()]
+    # A cargo no vessel can lift, so the minimum-cargo rejection is covered
+    # alongside the missing-distance ones already in the grid
+    cargoes.append(dataclasses.replace(cargoes[0], name='Oversize Test Cargo', quantity=400000))
+    return calc, vessels, cargoes
+
+
+def test_batch_matches_scalar():
+    """batch.row(i, j) equals calculate_voyage for every pair and scenario."""
+    calc, vessels, cargoes = _build_grid()
+
+    checked = 0
+    rejected = 0
+    for use_eco_speed in (False, True):
+        for adjustment, delay in SCENARIOS:
+            kwargs = dict(
+                use_eco_speed=use_eco_speed,
+                bunker_price_adjustment=adjustment,
+                extra_port_delay_days=delay,
+            )
+            batch = calc.calculate_voyage_batch(vessels, cargoes, **kwargs)
+
+            for i, vessel in enumerate(vessels):
+                for j, cargo in enumerate(cargoes):
+                    try:
+                        expected = calc.calculate_voyage(vessel, cargo, **kwargs)
+                    except ValueError:
+                        expected = None
+                        rejected += 1
+                    got = batch.row(i, j)
+                    assert got == expected, (vessel.name, cargo.name, kwargs, got, expected)
+                    checked += 1
+
+    assert rejected, "grid has no rejected pairs"
+    print(f"[OK] calculate_voyage_batch matches calculate_voyage for {checked} pairs "
+          f"({rejected} rejected by both)")
+
+
+def test_buffer_columns_and_mask():
+    """Dict-style columns, the valid mask, and NaN in invalid cells."""
+    calc, vessels, cargoes = _build_grid()
+    batch = calc.calculate_voyage_batch(vessels, cargoes)
+    shape = (len(vessels), len(cargoes))
+
+    # One column per per-pair VoyageResult field, plus 'valid'
+    per_pair = {f.name for f in dataclasses.fields(VoyageResult)} - {
+        'vessel_name', 'cargo_name', 'laycan_start', 'laycan_end'}
+    assert set(batch.keys()) == per_pair | {'valid'}
+    for name in batch.keys():
+        assert batch[name] is batch.columns[name]
+        assert batch[name].shape == shape, (name, batch[name].shape)
+    assert batch['arrival_date'].dtype.kind == 'M'
+    assert batch['selected_bunker_port'].dtype == object
+
+    valid = batch.valid
+    assert valid is batch['valid']
+    assert valid.dtype == bool
+    assert valid.any() and not valid.all(), "grid needs valid and invalid pairs"
+
+    # row() is None exactly where the mask is False
+    for i in range(shape[0]):
+        for j in range(shape[1]):
+            assert (batch.row(i, j) is None) == (not valid[i, j]), (i, j)
+
+    # Float metrics are NaN in invalid cells and finite in valid ones
+    for name in batch.keys():
+        col = batch[name]
+        if col.dtype != np.float64:
+            continue
+        assert np.isnan(col[~valid]).all(), name
+        assert np.isfinite(col[valid]).all(), name
+
+    print(f"[OK] VoyageResultBuffer columns/mask consistent "
+          f"({int(valid.sum())} valid, {int((~valid).sum())} invalid pairs)")
+
+
+def test_buffer_row_rounding():
+    """Columns hold unrounded values; row() rounds floats to 2 dp."""
+    calc, vessels, cargoes = _build_grid()
+    batch = calc.calculate_voyage_batch(vessels, cargoes, use_eco_speed=True)
+
+    unrounded_seen = False
+    for i, j in np.argwhere(batch.valid):
+        row = batch.row(i, j)
+        assert row.vessel_name == vessels[i].name
+        assert row.cargo_name == cargoes[j].name
+        assert isinstance(row.arrival_date, datetime)
+        assert isinstance(row.laycan_start, datetime)
+        assert isinstance(row.cargo_quantity, int)
+        assert row == row.rounded()
+
+        for f in dataclasses.fields(row):
+            value = getattr(row, f.name)
+            if not isinstance(value, float):
+                continue
+            # Plain Python floats, never NumPy scalars
+            assert type(value) is float, (f.name, type(value))
+            raw = batch[f.name][i, j].item()
+            assert value == round(raw, 2), (f.name, value, raw)
+            unrounded_seen |= raw != value
+
+    assert unrounded_seen, "buffer columns look pre-rounded"
+    print("[OK] VoyageResultBuffer.row() rounds unrounded columns to 2 dp")
+
+
+if __name__ == '__main__':
+    test_batch_matches_scalar()
+    test_buffer_columns_and_mask()
+    test_buffer_row_rounding()